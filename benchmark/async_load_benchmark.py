@@ -0,0 +1,81 @@
+'''
+asyncio 렌더러 부하 테스트
+동시에 여러 요청을 보내는 동안 이벤트 루프가 얼마나 늦게 깨어나는지(지연 시간)를 잰다
+루프에서 바로 생성하는 경우와 스레드/프로세스 executor를 쓰는 경우를 비교한다
+
+실행: python -m benchmark.async_load_benchmark
+'''
+import asyncio
+import concurrent.futures
+import statistics
+import time
+
+import qrcode.aqrcode as aqrcode
+import qrcode.constants as constants
+
+from benchmark.common import payload_for_version
+
+# 루프 지연 측정 간격 (초)
+TICK = 0.005
+
+
+async def measure_loop_lag(stop, lags):
+    '''
+    TICK마다 깨어나서 예정보다 늦어진 시간을 기록하는 코루틴
+    '''
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def run_load(render, payloads, concurrency):
+    stop = asyncio.Event()
+    lags = []
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    start = time.perf_counter()
+    for i in range(0, len(payloads), concurrency):
+        await asyncio.gather(*(render(data) for data in payloads[i:i + concurrency]))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed, lags
+
+
+def blocking_render(data):
+    '''
+    executor 없이 이벤트 루프에서 바로 생성 (비교 기준)
+    '''
+    async def render():
+        return aqrcode.render_bytes(data, constants.ERROR_LEVEL_M)
+    return render()
+
+
+def report(name, count, elapsed, lags):
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(f'{name:>10}: {count / elapsed:8.1f} codes/s, loop lag p50 {statistics.median(lags) * 1000:7.2f} ms, '
+          f'p99 {p99 * 1000:7.2f} ms, max {lags[-1] * 1000:7.2f} ms')
+
+
+def main(requests=200, concurrency=20, version=10):
+    # 절반은 서로 다른 데이터, 절반은 같은 데이터 (동시 요청 합치기 확인)
+    base = payload_for_version(version, constants.ERROR_LEVEL_M)
+    payloads = [base[:-4] + f'{i:04d}' if i % 2 else base for i in range(requests)]
+
+    elapsed, lags = asyncio.run(run_load(blocking_render, payloads, concurrency))
+    report('blocking', requests, elapsed, lags)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        renderer = aqrcode.AsyncRenderer(executor, max_concurrency=4)
+        elapsed, lags = asyncio.run(run_load(renderer.render, payloads, concurrency))
+    report('thread', requests, elapsed, lags)
+
+    with concurrent.futures.ProcessPoolExecutor(4) as executor:
+        renderer = aqrcode.AsyncRenderer(executor, max_concurrency=4)
+        elapsed, lags = asyncio.run(run_load(renderer.render, payloads, concurrency))
+    report('process', requests, elapsed, lags)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+'''
+벤치마크 공통 함수
+'''
+import random
+
+import qrcode.constants as constants
+import qrcode.util as util
+
+# 모드별로 임의 데이터를 만들 때 사용할 문자
+MODE_CHARS = {
+    'Numeric': '0123456789',
+    'Alphanumeric': '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:',
+    'Byte': 'abcdefghijklmnopqrstuvwxyz0123456789/?=&',
+}
+
+
+def payload_for_version(version, ecc_level, mode='Byte', seed=0):
+    '''
+    해당 버전/ecc level에 들어가는 가장 긴 임의 데이터 생성
+    :param version: qr코드 버전
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param mode: qr코드 모드
+    :param seed: 난수 시드
+    :return: 데이터 string
+    '''
+    rnd = random.Random(seed * 1000 + version)
+    chars = MODE_CHARS[mode]
+    # 이진 탐색으로 해당 버전 안에 들어가는 최대 길이 찾기
+    low, high = 1, 8000
+    while low < high:
+        mid = (low + high + 1) // 2
+        try:
+            fits = util.get_version(mid, mode, ecc_level) <= version
+        except ValueError:
+            fits = False
+        if fits:
+            low = mid
+        else:
+            high = mid - 1
+    return ''.join(rnd.choice(chars) for _ in range(low))
+
+
+ECC_LEVELS = (constants.ERROR_LEVEL_L, constants.ERROR_LEVEL_M,
+              constants.ERROR_LEVEL_Q, constants.ERROR_LEVEL_H)
@@ -0,0 +1,42 @@
+'''
+디스크 캐시 벤치마크
+캐시가 빈 상태(cold), 모두 캐시된 상태(warm), 일부만 캐시된 상태(mixed)에서
+렌더링 처리량을 캐시 없이 생성하는 경우와 비교한다
+
+실행: python -m benchmark.disk_cache_benchmark
+'''
+import random
+import tempfile
+import time
+
+import qrcode.constants as constants
+import qrcode.disk_cache as disk_cache
+from qrcode.qrcode import QRCode
+
+
+def run(name, payloads, render):
+    start = time.perf_counter()
+    for data in payloads:
+        render(data)
+    elapsed = time.perf_counter() - start
+    print(f'{name:>14}: {len(payloads) / elapsed:9.1f} codes/s')
+
+
+def main(count=300, mixed_hit_ratio=0.8):
+    rnd = random.Random(0)
+    payloads = [f'https://example.com/item/{i}?ref={rnd.randrange(10 ** 6)}' for i in range(count)]
+
+    run('no cache', payloads, lambda data: QRCode(data, constants.ERROR_LEVEL_M).to_bytes('png'))
+    with tempfile.TemporaryDirectory() as directory:
+        cache = disk_cache.DiskCache(directory)
+        render = lambda data: disk_cache.render(cache, data)
+        run('cold', payloads, render)
+        run('warm', payloads, render)
+        # mixed_hit_ratio 만큼은 캐시된 데이터, 나머지는 새 데이터
+        mixed = [data if rnd.random() < mixed_hit_ratio else data + '&new' for data in payloads]
+        run(f'mixed({mixed_hit_ratio:.0%} hit)', mixed, render)
+        print(f'{"stats":>14}: {cache.stats()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+'''
+데이터 인코딩 처리량 벤치마크
+버전 40 근처의 1KB 이상 데이터로 모드 판별과 모드별 세그먼트 인코딩을
+기존 방식(정규식 두 번, 글자마다 index/int/format)과 테이블 기반 일괄 인코더로 비교한다
+
+실행: python -m benchmark.encode_benchmark
+'''
+import re
+import time
+
+import qrcode.constants as constants
+import qrcode.util as util
+from qrcode.bitbuffer import BitBuffer
+
+from benchmark.common import payload_for_version
+
+
+def legacy_determine_mode(data):
+    '''
+    테이블 도입 이전의 모드 판별 (정규식 두 번)
+    '''
+    if re.match(r'^[0-9]+$', data):
+        return 'Numeric'
+    elif re.match(r'^[0-9A-Z $%*+\-./:]+$', data):
+        return 'Alphanumeric'
+    return 'Byte'
+
+
+def legacy_encode(data, mode):
+    '''
+    테이블 도입 이전의 세그먼트 인코딩 (묶음마다 BitBuffer.put)
+    '''
+    buffer = BitBuffer()
+    if mode == 'Numeric':
+        for i in range(0, len(data), 3):
+            group = data[i:i + 3]
+            buffer.put(int(group), len(group) * 3 + 1)
+    elif mode == 'Alphanumeric':
+        chars = constants.ALPHANUMERIC_CHARS
+        for i in range(0, len(data), 2):
+            if i + 1 < len(data):
+                buffer.put(chars.index(data[i]) * 45 + chars.index(data[i + 1]), 11)
+            else:
+                buffer.put(chars.index(data[i]), 6)
+    else:
+        for byte in data.encode('utf-8'):
+            buffer.put(int(format(byte, '08b'), 2), 8)
+    return buffer
+
+
+def table_encode(data, mode):
+    buffer = BitBuffer()
+    encoded, classes = util.classify(data)
+    if mode == 'Byte':
+        buffer.put_bytes(encoded)
+    else:
+        buffer.put(*util.SEGMENT_ENCODERS[mode](encoded))
+    return buffer
+
+
+def measure(func, *args, repeat=50):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    print(f'{"mode":<14} {"bytes":>6} {"detect old(us)":>15} {"detect new(us)":>15} '
+          f'{"encode old(us)":>15} {"encode new(us)":>15} {"MB/s":>7}')
+    for mode in ('Numeric', 'Alphanumeric', 'Byte'):
+        for version in (30, 35, 40):
+            data = payload_for_version(version, constants.ERROR_LEVEL_L, mode)
+            # 두 방식의 결과가 같은지 확인
+            assert legacy_determine_mode(data) == util.determine_mode(data) == mode
+            assert legacy_encode(data, mode).to_bytes() == table_encode(data, mode).to_bytes()
+
+            detect_old = measure(legacy_determine_mode, data)
+            detect_new = measure(util.determine_mode, data)
+            encode_old = measure(legacy_encode, data, mode, repeat=10)
+            encode_new = measure(table_encode, data, mode)
+            print(f'{mode:<14} {len(data):>6} {detect_old * 1e6:>15.1f} {detect_new * 1e6:>15.1f} '
+                  f'{encode_old * 1e6:>15.1f} {encode_new * 1e6:>15.1f} '
+                  f'{len(data) / encode_new / 1e6:>7.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+'''
+출력 형식별 벤치마크
+버전 1~40의 qr코드를 PNG(스트리밍)와 SVG/PDF/EPS로 저장할 때의
+출력 크기와 시간을 비교한다
+
+실행: python -m benchmark.output_benchmark
+'''
+import io
+import time
+
+import qrcode.constants as constants
+from qrcode.qrcode import QRCode
+
+from benchmark.common import payload_for_version
+
+# 비교할 출력 함수
+OUTPUTS = ('png', 'svg', 'pdf', 'eps')
+
+
+def main(box_size=10, repeat=3):
+    print(f'{"version":>7} ' + ' '.join(f'{f + "(B)":>9} {f + "(ms)":>9}' for f in OUTPUTS))
+    for version in range(1, 41):
+        qr = QRCode(payload_for_version(version, constants.ERROR_LEVEL_M), constants.ERROR_LEVEL_M)
+        assert qr.version == version
+        row = []
+        for output in OUTPUTS:
+            save = getattr(qr, f'save_{output}')
+            start = time.perf_counter()
+            for _ in range(repeat):
+                stream = io.BytesIO()
+                save(stream, box_size=box_size)
+            elapsed = (time.perf_counter() - start) / repeat
+            row.append(f'{len(stream.getvalue()):>9} {elapsed * 1000:>9.2f}')
+        print(f'{version:>7} ' + ' '.join(row))
+
+
+if __name__ == '__main__':
+    main()
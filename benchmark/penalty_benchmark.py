@@ -0,0 +1,57 @@
+'''
+마스크 패널티 계산 방식 비교 벤치마크
+버전 1~40의 실제 마스크 후보 8개에 대해 계산 방식별 시간을 재고
+모든 방식이 기존 evaluate_mask와 같은 점수를 내는지 확인한다
+
+실행: python -m benchmark.penalty_benchmark
+'''
+import random
+import time
+
+import qrcode.constants as constants
+import qrcode.layout as layout
+import qrcode.util as util
+
+
+def get_candidates(version, rnd):
+    '''
+    버전의 데이터 영역을 임의의 비트로 채운 마스크 후보 8개 생성
+    '''
+    module_count = layout.get_module_count(version)
+    data_modules = bytearray(layout.get_template(version))
+    for idx in layout.get_data_path(version):
+        data_modules[idx] = rnd.getrandbits(1)
+    data_modules = int.from_bytes(data_modules, 'big')
+    candidates = []
+    for mask_bit in constants.MASK_BITS:
+        option = data_modules ^ layout.get_mask_planes(version)[mask_bit]
+        option |= layout.get_format_plane(version, constants.ERROR_LEVEL_M, mask_bit)
+        flat = option.to_bytes(module_count * module_count, 'big')
+        candidates.append([list(flat[i:i + module_count]) for i in range(0, len(flat), module_count)])
+    return candidates
+
+
+def main(repeat=3):
+    rnd = random.Random(0)
+    backends = list(util.MASK_EVALUATORS)
+    print(f'{"version":>7} ' + ' '.join(f'{b + "(ms)":>14}' for b in backends))
+    totals = dict.fromkeys(backends, 0.0)
+    for version in range(1, 41):
+        candidates = get_candidates(version, rnd)
+        module_count = layout.get_module_count(version)
+        expected = util.evaluate_masks(candidates, module_count, 'python')
+        row = []
+        for backend in backends:
+            assert util.evaluate_masks(candidates, module_count, backend) == expected, backend
+            start = time.perf_counter()
+            for _ in range(repeat):
+                util.evaluate_masks(candidates, module_count, backend)
+            elapsed = (time.perf_counter() - start) / repeat
+            totals[backend] += elapsed
+            row.append(f'{elapsed * 1000:>14.2f}')
+        print(f'{version:>7} ' + ' '.join(row))
+    print('total: ' + ', '.join(f'{b} {t * 1000:.1f} ms' for b, t in totals.items()))
+
+
+if __name__ == '__main__':
+    main()
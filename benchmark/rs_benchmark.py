@@ -0,0 +1,72 @@
+'''
+Reed-Solomon 에러 정정 코드워드 생성 벤치마크
+40개 버전 x 4개 ecc level의 블록 구성에 대해 심볼 하나당 RS 비용을
+테이블/생성 다항식을 매번 다시 만드는 기존 방식과 캐시된 인코더로 비교한다
+
+실행: python -m benchmark.rs_benchmark
+'''
+import random
+import time
+
+import error_correction.reed_solomon as reed_solomon
+import qrcode.constants as constants
+
+
+def legacy_rs_remainder(msg_in, nsym):
+    '''
+    캐시 도입 이전의 rs_encode_msg 동작 (블록마다 테이블과 생성 다항식 재생성)
+    '''
+    exp, log = reed_solomon.init_galois_field()
+    gen = reed_solomon.generate_generator_polynomial(nsym, exp, log)
+    msg_out = list(msg_in) + [0] * nsym
+    return reed_solomon.poly_div(msg_out, gen, exp, log)
+
+
+def cached_rs_remainder(msg_in, nsym):
+    return reed_solomon.get_encoder(nsym).remainder(msg_in)
+
+
+def get_blocks(version, ecc_level, rnd):
+    '''
+    버전/ecc level의 블록 구성대로 임의의 데이터 코드워드 블록 생성
+    '''
+    blocks = []
+    error_block_size = constants.ERROR_BLOCK_TABLE[ecc_level][version - 1]
+    for i in range(0, len(error_block_size), 4):
+        block_count, total_count, data_count, _ = error_block_size[i:i + 4]
+        for _ in range(block_count):
+            blocks.append(([rnd.randrange(256) for _ in range(data_count)], total_count - data_count))
+    return blocks
+
+
+def time_symbol(func, blocks, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for msg, nsym in blocks:
+            func(msg, nsym)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat=5):
+    rnd = random.Random(0)
+    print(f'{"version":>7} {"ecc":>3} {"blocks":>6} {"before(ms)":>11} {"after(ms)":>10} {"speedup":>8}')
+    total_before = total_after = 0.0
+    for version in range(1, 41):
+        for ecc_level in (constants.ERROR_LEVEL_L, constants.ERROR_LEVEL_M,
+                          constants.ERROR_LEVEL_Q, constants.ERROR_LEVEL_H):
+            blocks = get_blocks(version, ecc_level, rnd)
+            # 두 방식의 결과가 같은지 먼저 확인
+            for msg, nsym in blocks:
+                assert legacy_rs_remainder(msg, nsym) == cached_rs_remainder(msg, nsym)
+            before = time_symbol(legacy_rs_remainder, blocks, repeat)
+            after = time_symbol(cached_rs_remainder, blocks, repeat)
+            total_before += before
+            total_after += after
+            print(f'{version:>7} {ecc_level:>3} {len(blocks):>6} '
+                  f'{before * 1000:>11.3f} {after * 1000:>10.3f} {before / after:>7.1f}x')
+    print(f'total: before {total_before * 1000:.1f} ms, after {total_after * 1000:.1f} ms, '
+          f'speedup {total_before / total_after:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
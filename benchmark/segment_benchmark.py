@@ -0,0 +1,94 @@
+'''
+여러 모드 세그먼트 분할 효과 측정
+실제 서비스에서 자주 쓰는 형태의 URL 묶음으로 한 모드 인코딩과 세그먼트 분할 인코딩의
+qr코드 버전, 모듈 수, 인코딩 시간을 ecc level별로 비교한다
+
+실행: python -m benchmark.segment_benchmark
+'''
+import random
+import time
+
+import qrcode.layout as layout
+import qrcode.util as util
+from qrcode.qrcode import QRCode
+
+from benchmark.common import ECC_LEVELS
+
+HOSTS = ('shop.example.com', 'm.store.co.kr', 'x.io', 'track.delivery.kr', 'www.example.org', 'bit.ly')
+
+
+def make_url(rnd):
+    '''
+    임의의 현실적인 URL 하나 생성
+    '''
+    kind = rnd.randrange(6)
+    host = rnd.choice(HOSTS)
+    if kind == 0:
+        # 상품 번호
+        return f'https://{host}/products/{rnd.randrange(10 ** 9, 10 ** 12)}'
+    elif kind == 1:
+        # 송장 번호 조회
+        return f'https://{host}/tracking?invoice={rnd.randrange(10 ** 11, 10 ** 13)}&carrier=cj'
+    elif kind == 2:
+        # 대문자 쿠폰 코드
+        code = ''.join(rnd.choice('ABCDEFGHJKLMNPQRSTUVWXYZ23456789') for _ in range(12))
+        return f'https://{host}/coupon/{code}'
+    elif kind == 3:
+        # 짧은 링크
+        return f'https://{host}/' + ''.join(rnd.choice('abcdefghijkmnopqrstuvwxyzABCDEFGH0123456789') for _ in range(7))
+    elif kind == 4:
+        # 광고 추적 파라미터
+        return (f'https://{host}/event/{rnd.randrange(1000, 9999)}?utm_source=qr&utm_medium=print'
+                f'&utm_campaign=SPRING{rnd.randrange(2020, 2030)}&uid={rnd.randrange(10 ** 15, 10 ** 16)}')
+    # 전부 대문자로 쓴 URL (Alphanumeric 모드)
+    return f'HTTPS://{host.upper()}/ORDER/{rnd.randrange(10 ** 14, 10 ** 18)}'
+
+
+def encode_only(data, ecc_level):
+    '''
+    데이터 인코딩 단계만 실행한 QRCode
+    '''
+    qr = QRCode.__new__(QRCode)
+    qr.data = data
+    qr.ecc_level = ecc_level
+    qr.fixed_version = None
+    qr.fixed_mask_bit = None
+    qr.__encode_data__()
+    return qr
+
+
+def main(count=2000, seed=0):
+    rnd = random.Random(seed)
+    corpus = [make_url(rnd) for _ in range(count)]
+
+    print(f'{count} URLs')
+    print(f'{"ecc":<4} {"mixed":>7} {"smaller":>8} {"versions":>9} {"modules":>9} {"encode(us)":>11}')
+    for ecc_level in ECC_LEVELS:
+        mixed = smaller = saved_versions = 0
+        single_modules = mixed_modules = 0
+        single_versions = []
+        for data in corpus:
+            mode = util.determine_mode(data)
+            single_versions.append(util.get_version(util.get_data_length(data, mode), mode, ecc_level))
+
+        start = time.perf_counter()
+        symbols = [encode_only(data, ecc_level) for data in corpus]
+        encode_time = time.perf_counter() - start
+
+        for single_version, qr in zip(single_versions, symbols):
+            mixed += len(qr.segments) > 1
+            if qr.version < single_version:
+                smaller += 1
+                saved_versions += single_version - qr.version
+            single_modules += layout.get_module_count(single_version) ** 2
+            mixed_modules += layout.get_module_count(qr.version) ** 2
+        print(f'{ecc_level:<4} {mixed:>7} {smaller:>8} {saved_versions / count:>9.2f} '
+              f'{1 - mixed_modules / single_modules:>9.1%} '
+              f'{encode_time / count * 1e6:>11.1f}')
+    print('mixed: 여러 세그먼트로 나눈 수, smaller: 버전이 줄어든 수, '
+          'versions: URL당 평균 줄어든 버전, modules: 줄어든 전체 모듈 비율, '
+          'encode: 세그먼트 분할을 포함한 URL당 데이터 인코딩 시간')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+'''
+QRCode 생성 단계별 벤치마크 모음
+버전 1~40, 모든 ecc level에 대해 각 버전을 꽉 채우는 데이터로
+데이터 인코딩, RS 에러 정정, 행렬 생성, 8개 마스크 탐색, 이미지 출력 시간을 따로 잰다
+결과는 JSON으로 저장하고, 저장해 둔 기준 결과와 비교해서 느려진 단계가 있으면 실패(종료 코드 1)한다
+
+실행:
+  python -m benchmark.suite --output result.json
+  python -m benchmark.suite --versions 1-10 --baseline result.json --threshold 0.2
+'''
+import argparse
+import io
+import json
+import math
+import platform
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import qrcode.layout as layout
+import qrcode.timing as timing
+import qrcode.util as util
+from qrcode.qrcode import QRCode
+
+from benchmark.common import ECC_LEVELS, payload_for_version
+
+# 측정 단계 이름
+STAGES = ('encode', 'error_correction', 'matrix', 'mask_search', 'save_png', 'save_image')
+# 기준 결과와 비교할 때 이 값(초)보다 작은 차이는 측정 오차로 보고 무시
+MIN_DELTA = 50e-6
+
+
+def parse_range(text):
+    '''
+    '1-10,20,40' 형태의 문자열을 숫자 리스트로 바꾸는 함수
+    '''
+    values = []
+    for part in text.split(','):
+        start, _, end = part.partition('-')
+        values.extend(range(int(start), int(end or start) + 1))
+    return values
+
+
+def has_pillow():
+    try:
+        import PIL
+    except ImportError:
+        return False
+    return True
+
+
+def measure_symbol(data, ecc_level, image_path):
+    '''
+    timing collector를 켠 상태로 QRCode를 만들고 출력해서 단계별 시간을 구하는 함수
+    :return: 단계 이름 -> 초
+    '''
+    with timing.collect():
+        qr = QRCode(data, ecc_level)
+    stages = qr.timing.stages
+    timings = {
+        'encode': stages['encode'],
+        'error_correction': stages['error_correction'],
+        'matrix': stages['placement'],
+        # 마스크 후보 생성과 패널티 계산을 합친 시간
+        'mask_search': stages['evaluate_masks'] + sum(
+            elapsed for stage, elapsed in stages.items() if stage.startswith('mask_')),
+    }
+
+    # 출력 시간은 record의 render 단계에 누적됨
+    qr.save_png(io.BytesIO())
+    timings['save_png'] = stages['render']
+
+    if has_pillow():
+        qr.save_image(image_path)
+        timings['save_image'] = stages['render'] - timings['save_png']
+    return timings
+
+
+def summarize(version, ecc_level, data, samples):
+    '''
+    반복 측정 결과에서 단계별 중앙값을 구하고 진행 상황을 출력하는 함수
+    '''
+    stages = {stage: statistics.median(sample[stage] for sample in samples)
+              for stage in STAGES if stage in samples[0]}
+    total = sum(stages.values())
+    print(f'version {version:>2} {ecc_level}: ' +
+          ' '.join(f'{stage} {elapsed * 1000:.2f}' for stage, elapsed in stages.items()) +
+          f' | total {total * 1000:.2f} ms', file=sys.stderr)
+    return {
+        'version': version,
+        'ecc_level': ecc_level,
+        'payload_length': len(data),
+        'stages': stages,
+    }
+
+
+def run(versions, ecc_levels, repeat):
+    '''
+    모든 버전/ecc level 조합을 repeat번 측정해서 단계별 중앙값을 구하는 함수
+    '''
+    # 버전별 캐시는 실제 서비스처럼 미리 만들어 둔 상태에서 측정
+    layout.warm_up(versions)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        image_path = os.path.join(directory, 'benchmark.png')
+        for version in versions:
+            for ecc_level in ecc_levels:
+                data = payload_for_version(version, ecc_level)
+                samples = [measure_symbol(data, ecc_level, image_path) for _ in range(repeat)]
+                results.append(summarize(version, ecc_level, data, samples))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'mask_evaluator': util.DEFAULT_MASK_EVALUATOR,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    '''
+    기준 결과와 비교해서 threshold 비율 이상 느려진 단계를 찾는 함수
+    :return: 느려진 (버전, ecc level, 단계, 기준 초, 현재 초) 리스트
+    '''
+    base = {(r['version'], r['ecc_level']): r['stages'] for r in baseline['results']}
+    regressions = []
+    ratios = {}
+    for result in current['results']:
+        stages = base.get((result['version'], result['ecc_level']))
+        if stages is None:
+            continue
+        for stage, elapsed in result['stages'].items():
+            if stage not in stages:
+                continue
+            before = stages[stage]
+            ratios.setdefault(stage, []).append(elapsed / before if before else 1.0)
+            if elapsed > before * (1 + threshold) and elapsed - before > MIN_DELTA:
+                regressions.append((result['version'], result['ecc_level'], stage, before, elapsed))
+
+    print('stage              geomean(current / baseline)')
+    for stage, values in ratios.items():
+        geomean = math.exp(sum(math.log(max(v, 1e-9)) for v in values) / len(values))
+        print(f'{stage:<18} {geomean:.3f}')
+    for version, ecc_level, stage, before, elapsed in regressions:
+        print(f'REGRESSION version {version} {ecc_level} {stage}: '
+              f'{before * 1000:.3f} ms -> {elapsed * 1000:.3f} ms')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='QRCode 단계별 벤치마크')
+    parser.add_argument('--versions', default='1-40', help='측정할 버전 (예: 1-10,20,40)')
+    parser.add_argument('--ecc', default='LMQH', help='측정할 ecc level (예: LH)')
+    parser.add_argument('--repeat', type=int, default=3, help='조합마다 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (없으면 stdout)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.10, help='허용하는 최대 느려짐 비율 (기본값 0.10)')
+    args = parser.parse_args(argv)
+
+    ecc_levels = [ecc for ecc in ECC_LEVELS if ecc in args.ecc.upper()]
+    current = run(parse_range(args.versions), ecc_levels, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(current, file, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if compare(current, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -28,4 +28,15 @@ def bch_encode(data_int, n, k, gen_poly):
     data_poly += [0] * (n - k)
 
     rem = gf_poly_div(data_poly, gen_poly)
-    return ''.join(str(bit) for bit in rem)
\ No newline at end of file
+    return ''.join(str(bit) for bit in rem)
+
+def bch_verify(codeword_int, n, gen_poly):
+    '''
+    코드워드가 생성 다항식으로 나누어 떨어지는지 확인하는 함수
+    :param codeword_int: 데이터 + 에러 정정 비트 정수
+    :param n: 코드워드 비트 수
+    :param gen_poly: 생성 다항식
+    :return: 올바른 코드워드인지 여부
+    '''
+    codeword = [int(bit) for bit in format(codeword_int, f'0{n}b')]
+    return not any(gf_poly_div(codeword, gen_poly))
@@ -1,6 +1,7 @@
 '''
 Reed-Solomon 알고리즘 made by ChatGPT
 '''
+from functools import lru_cache
 
 def init_galois_field():
     exp = [0] * 512  # 지수 테이블
@@ -18,6 +19,12 @@ def init_galois_field():
 
     return exp, log
 
+# 모듈 로드 시 한 번만 만들어 두는 GF(256) 지수/로그 테이블
+GF_EXP, GF_LOG = init_galois_field()
+
+# 생성 다항식 캐시 크기 (QR코드 블록당 에러 정정 코드워드 수는 7~30개)
+GENERATOR_CACHE_SIZE = 32
+
 # 생성 다항식 생성
 def generate_generator_polynomial(nsym, exp, log):
     g = [1]
@@ -45,11 +52,53 @@ def poly_div(dividend, divisor, exp, log):
                     msg_out[i + j] ^= exp[(log[coef] + log[divisor[j]]) % 255]
     return msg_out[-(len(divisor) - 1):]
 
+class ReedSolomonEncoder(object):
+    '''
+    에러 정정 코드워드 개수(nsym)별로 재사용하는 인코더
+    생성 다항식을 한 번만 만들고 계수의 로그 값을 미리 계산해 둔다
+    '''
+
+    def __init__(self, nsym):
+        self.nsym = nsym
+        # 생성 다항식 (최고차항 계수 1 포함)
+        self.generator = tuple(generate_generator_polynomial(nsym, GF_EXP, GF_LOG))
+        # 최고차항을 제외한 (위치, 계수 로그) 목록, 0인 계수는 제외
+        self.generator_log = tuple(
+            (j, GF_LOG[g]) for j, g in enumerate(self.generator[1:], start=1) if g != 0
+        )
+
+    def remainder(self, msg_in):
+        '''
+        에러 정정 코드워드만 계산하는 함수
+        :param msg_in: 데이터 코드워드 리스트
+        :return: 에러 정정 코드워드 리스트
+        '''
+        exp = GF_EXP
+        log = GF_LOG
+        generator_log = self.generator_log
+        msg_out = list(msg_in) + [0] * self.nsym
+        for i in range(len(msg_in)):
+            coef = msg_out[i]
+            if coef != 0:
+                # 지수 테이블이 512개라서 % 255 연산 없이 바로 조회 가능
+                lc = log[coef]
+                for j, lg in generator_log:
+                    msg_out[i + j] ^= exp[lc + lg]
+        return msg_out[len(msg_in):]
+
+    def encode(self, msg_in):
+        '''
+        데이터 코드워드 뒤에 에러 정정 코드워드를 붙이는 함수
+        :param msg_in: 데이터 코드워드 리스트
+        :return: 데이터 + 에러 정정 코드워드 리스트
+        '''
+        return list(msg_in) + self.remainder(msg_in)
+
+# nsym별 인코더 캐시 (개수 제한)
+@lru_cache(maxsize=GENERATOR_CACHE_SIZE)
+def get_encoder(nsym):
+    return ReedSolomonEncoder(nsym)
+
 # 에러 정정 코드워드 생성
 def rs_encode_msg(msg_in, nsym):
-    exp, log = init_galois_field()
-    gen = generate_generator_polynomial(nsym, exp, log)
-    msg_out = [0] * (len(msg_in) + nsym)
-    msg_out[:len(msg_in)] = msg_in
-    remainder = poly_div(msg_out, gen, exp, log)
-    return msg_in + remainder
\ No newline at end of file
+    return get_encoder(nsym).encode(msg_in)
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+
+from qrcode.cli import main
+
+sys.exit(main())
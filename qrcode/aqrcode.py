@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import qrcode.cache as symbol_cache
+import qrcode.constants as constants
+from qrcode.qrcode import QRCode
+
+'''
+asyncio용 QRCode 생성 모듈
+QRCode 생성과 이미지 출력은 CPU만 쓰는 작업이라 이벤트 루프를 막지 않도록 executor에서 실행한다
+동시에 실행되는 작업 수를 제한하고, 같은 요청이 동시에 들어오면 한 번만 생성한다
+'''
+
+def render_bytes(data, ecc_level=constants.ERROR_LEVEL_M, fmt='png', box_size=4, border=4):
+    '''
+    QRCode를 만들어 출력 형식의 bytes로 돌려주는 함수 (executor에서 실행)
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param fmt: 출력 형식 (png, svg, pdf, eps)
+    :param box_size: 모듈 하나의 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :return: 이미지 bytes
+    '''
+    return QRCode(data, ecc_level).to_bytes(fmt, box_size, border)
+
+# executor를 지정하지 않은 렌더러가 같이 쓰는 스레드 executor (처음 사용할 때 생성)
+default_executor = None
+default_executor_lock = threading.Lock()
+
+def get_default_executor():
+    global default_executor
+    with default_executor_lock:
+        if default_executor is None:
+            default_executor = ThreadPoolExecutor(thread_name_prefix='qrcode-render')
+        return default_executor
+
+class LoopState(object):
+    '''
+    이벤트 루프 하나에 묶인 렌더러 상태 (세마포어, 실행 중인 요청)
+    '''
+    def __init__(self, max_concurrency):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # 실행 중인 요청 -> [작업, 기다리는 수]
+        self.in_flight = {}
+
+class AsyncRenderer(object):
+    '''
+    executor에서 QRCode를 만드는 비동기 렌더러
+    여러 이벤트 루프(다른 스레드, 여러 번의 asyncio.run)에서 같이 사용할 수 있다
+    '''
+
+    def __init__(self, executor=None, max_concurrency=8, cache=None):
+        '''
+        :param executor: 작업을 실행할 executor (None이면 모든 렌더러가 같이 쓰는 스레드 executor)
+        :param max_concurrency: 이벤트 루프마다 동시에 실행할 최대 작업 수
+        :param cache: 결과를 보관할 SymbolCache (None이면 사용 안 함)
+        '''
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        # 이벤트 루프 -> LoopState (세마포어와 작업은 만든 루프에서만 사용할 수 있음)
+        self.states = weakref.WeakKeyDictionary()
+        self.lock = threading.Lock()
+
+    def __get_state__(self, loop):
+        with self.lock:
+            state = self.states.get(loop)
+            if state is None:
+                state = self.states[loop] = LoopState(self.max_concurrency)
+            return state
+
+    async def __run__(self, key, semaphore):
+        loop = asyncio.get_running_loop()
+        await semaphore.acquire()
+        future = (self.executor or get_default_executor()).submit(render_bytes, *key)
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘
+                pass
+        # executor 작업이 실제로 끝나거나 실행 전에 취소될 때 자리를 돌려줌
+        # (기다리던 요청이 취소되어도 이미 시작한 작업은 끝까지 실행되므로 그동안 자리를 차지함)
+        future.add_done_callback(release)
+        try:
+            result = await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            # 아직 시작하지 않은 작업만 취소됨
+            future.cancel()
+            raise
+        if self.cache is not None:
+            data, ecc_level, fmt, box_size, border = key
+            self.cache.put(symbol_cache.get_key(data, ecc_level, None, None, fmt, box_size, border), result)
+        return result
+
+    async def render(self, data, ecc_level=constants.ERROR_LEVEL_M, fmt='png', box_size=4, border=4):
+        '''
+        QRCode를 만들어 출력 형식의 bytes로 돌려주는 함수
+        같은 이벤트 루프에서 같은 요청이 이미 실행 중이면 그 결과를 같이 기다린다
+        :param data: 입력 데이터
+        :param ecc_level: qr코드 오류 정정 레벨
+        :param fmt: 출력 형식 (png, svg, pdf, eps)
+        :param box_size: 모듈 하나의 크기
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        :return: 이미지 bytes
+        '''
+        if self.cache is not None:
+            result = self.cache.get(symbol_cache.get_key(data, ecc_level, None, None, fmt, box_size, border))
+            if result is not None:
+                return result
+        state = self.__get_state__(asyncio.get_running_loop())
+        in_flight = state.in_flight
+        key = (data, ecc_level, fmt, box_size, border)
+        entry = in_flight.get(key)
+        if entry is None:
+            entry = [asyncio.ensure_future(self.__run__(key, state.semaphore)), 0]
+            in_flight[key] = entry
+            entry[0].add_done_callback(lambda _: forget(in_flight, key, entry))
+        entry[1] += 1
+        try:
+            # 한 요청이 취소되어도 같은 작업을 기다리는 다른 요청에는 영향이 없도록 shield
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            # 기다리는 요청이 모두 취소되면 작업도 취소 (executor에서 이미 실행 중인 작업은 끝까지 실행됨)
+            if entry[1] == 1:
+                entry[0].cancel()
+                # 취소된 작업을 바로 빼서 이후 같은 요청은 새로 생성
+                forget(in_flight, key, entry)
+            raise
+        finally:
+            entry[1] -= 1
+
+def forget(in_flight, key, entry):
+    '''
+    실행 중인 요청 목록에서 작업을 빼는 함수 (같은 요청으로 새로 시작된 작업은 그대로 둠)
+    '''
+    if in_flight.get(key) is entry:
+        del in_flight[key]
+
+# 기본 렌더러
+default_renderer = AsyncRenderer()
+
+async def render(data, ecc_level=constants.ERROR_LEVEL_M, fmt='png', box_size=4, border=4):
+    '''
+    기본 렌더러로 QRCode를 만들어 출력 형식의 bytes로 돌려주는 함수
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param fmt: 출력 형식 (png, svg, pdf, eps)
+    :param box_size: 모듈 하나의 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :return: 이미지 bytes
+    '''
+    return await default_renderer.render(data, ecc_level, fmt, box_size, border)
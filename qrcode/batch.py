@@ -0,0 +1,181 @@
+import itertools
+import multiprocessing
+
+import qrcode.constants as constants
+import qrcode.layout as layout
+import qrcode.timing as timing
+from qrcode.qrcode import QRCode
+
+'''
+여러 데이터를 한 번에 QRCode로 만드는 모듈
+프로세스 풀로 여러 코어에 나눠서 생성한다
+'''
+
+# 워커 시작 시 캐시를 미리 만들어 둘 기본 버전 (짧은 URL 대부분이 들어가는 범위)
+DEFAULT_WARM_VERSIONS = range(1, 11)
+
+# 워커 프로세스에서 qr코드마다 만들어 결과와 같이 돌려줄 collector 클래스 (None이면 측정하지 않음)
+worker_timings_type = None
+
+def init_worker(warm_versions, timings_type=None):
+    '''
+    워커 프로세스 초기화 함수
+    :param warm_versions: 캐시를 미리 만들어 둘 qr코드 버전 목록
+    :param timings_type: 부모 프로세스 collector의 클래스 (None이면 측정하지 않음)
+    '''
+    global worker_timings_type
+    layout.warm_up(warm_versions)
+    # fork로 물려받은 부모의 collector는 사용하지 않고, 측정 결과는 qr코드마다 부모로 돌려보냄
+    timing.active = None
+    worker_timings_type = timings_type
+
+def new_worker_timings():
+    '''
+    qr코드 하나의 측정 결과를 담아 부모 프로세스로 보낼 collector를 만드는 함수
+    현재 프로세스에서 생성할 때는 None (timing.active에 바로 기록됨)
+    '''
+    return None if worker_timings_type is None else worker_timings_type()
+
+def make_qrcode(args):
+    '''
+    워커 프로세스에서 QRCode 하나를 만드는 함수
+    :param args: (데이터, 오류 정정 레벨)
+    :return: (QRCode, 측정 결과 collector 또는 None)
+    '''
+    data, ecc_level = args
+    timings = new_worker_timings()
+    return QRCode(data, ecc_level, timings=timings), timings
+
+def render_qrcode(args):
+    '''
+    워커 프로세스에서 QRCode 하나를 만들어 이미지 bytes로 바꾸는 함수
+    :param args: (데이터, 오류 정정 레벨, 출력 형식, 모듈 크기, 여백, 고정할 버전)
+    :return: (이미지 bytes, 측정 결과 collector 또는 None)
+    '''
+    data, ecc_level, fmt, box_size, border, version = args
+    timings = new_worker_timings()
+    return QRCode(data, ecc_level, version, timings=timings).to_bytes(fmt, box_size, border), timings
+
+def merge_timings(results, collector):
+    '''
+    워커에서 돌려받은 측정 결과를 현재 프로세스의 collector에 합치고 결과만 돌려주는 제너레이터
+    :param results: (결과, 측정 결과 collector 또는 None) iterable
+    :param collector: 합칠 collector (None이면 버림)
+    :return: 입력 순서대로 결과
+    '''
+    for result, timings in results:
+        if timings is not None and collector is not None:
+            collector.merge(timings)
+            # 같은 묶음의 중복 데이터는 같은 결과를 다시 받으므로 한 번만 합쳐지도록 비움
+            timings.clear()
+        yield result
+
+def generate_many(
+    iterable,
+    ecc_level=constants.ERROR_LEVEL_M,
+    workers=None,
+    chunksize=64,
+    warm_versions=DEFAULT_WARM_VERSIONS
+):
+    '''
+    여러 데이터로 QRCode를 만들어 입력 순서대로 하나씩 돌려주는 제너레이터
+    입력을 일정 개수씩 나눠서 처리하므로 입력이 아주 길어도 메모리 사용량이 일정하고,
+    같은 묶음 안의 중복 데이터는 한 번만 생성한다
+    :param iterable: 데이터 string iterable
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param workers: 프로세스 수 (None이면 CPU 개수, 1이면 현재 프로세스에서 생성)
+    :param chunksize: 워커에 한 번에 넘기는 데이터 개수
+    :param warm_versions: 워커 시작 시 캐시를 미리 만들어 둘 qr코드 버전 목록
+    :return: 입력 순서대로 QRCode
+    '''
+    collector = timing.active
+    results = run_many(iterable, make_qrcode, (ecc_level,), workers, chunksize, warm_versions, collector)
+    for qrcode in merge_timings(results, collector):
+        # 워커에서 만든 qr코드도 이후 출력 시간은 현재 프로세스의 collector에 기록
+        if qrcode.timings is None:
+            qrcode.timings = collector
+        yield qrcode
+
+def render_many(
+    iterable,
+    ecc_level=constants.ERROR_LEVEL_M,
+    fmt='png',
+    box_size=4,
+    border=4,
+    version=None,
+    workers=None,
+    chunksize=64,
+    warm_versions=DEFAULT_WARM_VERSIONS
+):
+    '''
+    여러 데이터로 qr코드 이미지 bytes를 만들어 입력 순서대로 하나씩 돌려주는 제너레이터
+    워커에서 이미지까지 만들어서 QRCode 객체 대신 bytes만 주고받는다
+    :param iterable: 데이터 string iterable
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param fmt: 출력 형식 (png, svg, pdf, eps)
+    :param box_size: 모듈 하나의 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :param version: 고정할 qr코드 버전 (None이면 데이터가 들어가는 최소 버전)
+    :param workers: 프로세스 수 (None이면 CPU 개수, 1이면 현재 프로세스에서 생성)
+    :param chunksize: 워커에 한 번에 넘기는 데이터 개수
+    :param warm_versions: 워커 시작 시 캐시를 미리 만들어 둘 qr코드 버전 목록
+    :return: 입력 순서대로 이미지 bytes
+    '''
+    collector = timing.active
+    options = (ecc_level, fmt, box_size, border, version)
+    results = run_many(iterable, render_qrcode, options, workers, chunksize, warm_versions, collector)
+    return merge_timings(results, collector)
+
+def run_many(iterable, func, options, workers, chunksize, warm_versions, collector=None):
+    '''
+    프로세스 풀로 데이터마다 func((데이터,) + options)를 실행하는 제너레이터
+    :param iterable: 데이터 string iterable
+    :param func: 워커에서 실행할 함수
+    :param options: 데이터 뒤에 붙여서 넘길 인자 tuple
+    :param workers: 프로세스 수 (None이면 CPU 개수, 1이면 현재 프로세스에서 생성)
+    :param chunksize: 워커에 한 번에 넘기는 데이터 개수
+    :param warm_versions: 워커 시작 시 캐시를 미리 만들어 둘 qr코드 버전 목록
+    :param collector: 측정 결과를 모을 현재 프로세스의 collector (워커는 같은 클래스로 결과를 돌려줌)
+    :return: 입력 순서대로 결과
+    '''
+    workers = workers or multiprocessing.cpu_count()
+    warm_versions = tuple(warm_versions)
+
+    # 프로세스 1개면 풀 없이 현재 프로세스에서 생성
+    if workers == 1:
+        layout.warm_up(warm_versions)
+        yield from generate_batches(iterable, func, options, map, chunksize * 4)
+        return
+
+    with multiprocessing.Pool(workers, initializer=init_worker,
+                              initargs=(warm_versions, None if collector is None else type(collector))) as pool:
+        def mapper(func, items):
+            return pool.imap(func, items, chunksize)
+        # 워커마다 몇 개의 chunk가 돌아가도록 묶음 크기 결정
+        yield from generate_batches(iterable, func, options, mapper, chunksize * workers * 4)
+
+def generate_batches(iterable, func, options, mapper, batch_size):
+    '''
+    입력을 batch_size개씩 나눠서 중복을 제거한 뒤 mapper로 실행하는 제너레이터
+    :param iterable: 데이터 string iterable
+    :param func: 실행할 함수
+    :param options: 데이터 뒤에 붙여서 넘길 인자 tuple
+    :param mapper: map과 같은 형태의 함수 (입력 순서대로 결과를 돌려줘야 함)
+    :param batch_size: 한 번에 처리할 데이터 개수
+    :return: 입력 순서대로 결과
+    '''
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            break
+        # 묶음 안의 중복 데이터 제거 (처음 나온 순서 유지)
+        unique = list(dict.fromkeys(batch))
+        results = {}
+        position = 0
+        for data, result in zip(unique, mapper(func, [(data,) + options for data in unique])):
+            results[data] = result
+            # 앞에서부터 완성된 결과는 바로 돌려주기
+            while position < len(batch) and batch[position] in results:
+                yield results[batch[position]]
+                position += 1
@@ -0,0 +1,53 @@
+'''
+BitBuffer 클래스
+'0'/'1' 문자열 대신 bytearray에 비트를 차곡차곡 채우는 버퍼
+8비트가 모일 때마다 바이트로 옮기므로 긴 데이터도 선형 시간에 만들어진다
+'''
+
+class BitBuffer(object):
+    def __init__(self):
+        # 완성된 바이트
+        self.buffer = bytearray()
+        # 아직 8비트가 안 된 남은 비트와 그 개수
+        self.pending = 0
+        self.pending_length = 0
+
+    def __len__(self):
+        '''
+        :return: 지금까지 추가된 비트 수
+        '''
+        return len(self.buffer) * 8 + self.pending_length
+
+    def put(self, value, length):
+        '''
+        정수 값을 지정한 비트 수만큼 추가하는 함수
+        :param value: 추가할 값 (length 비트 이내)
+        :param length: 비트 수
+        '''
+        self.pending = (self.pending << length) | value
+        self.pending_length += length
+        # 8비트 이상 모였으면 완성된 바이트를 버퍼로 옮기기
+        if self.pending_length >= 8:
+            rest = self.pending_length % 8
+            self.buffer += (self.pending >> rest).to_bytes(self.pending_length // 8, 'big')
+            self.pending &= (1 << rest) - 1
+            self.pending_length = rest
+
+    def put_bytes(self, data):
+        '''
+        바이트 단위 데이터를 한 번에 추가하는 함수
+        :param data: 추가할 bytes
+        '''
+        if self.pending_length == 0:
+            self.buffer += data
+        else:
+            self.put(int.from_bytes(data, 'big'), len(data) * 8)
+
+    def to_bytes(self):
+        '''
+        버퍼를 bytes로 바꾸는 함수 (마지막 바이트의 남는 비트는 0)
+        :return: 코드워드 bytes
+        '''
+        if self.pending_length == 0:
+            return bytes(self.buffer)
+        return bytes(self.buffer) + bytes([self.pending << (8 - self.pending_length)])
@@ -0,0 +1,95 @@
+import itertools
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+
+import error_correction.reed_solomon as reed_solomon
+import qrcode.constants as constants
+import qrcode.layout as layout
+
+'''
+(버전, 오류 정정 레벨)별 블록 구성 계획 모듈
+데이터 코드워드를 나누는 블록 경계와 데이터/오류 정정 코드워드를 섞는 순서를 한 번만 계산해서
+심볼마다 블록별 RS 계산 후 한 번의 gather로 최종 코드워드를 만든다
+'''
+
+class BlockPlan(namedtuple('BlockPlan', (
+    'version',          # qr코드 버전
+    'ecc_level',        # 오류 정정 레벨
+    'data_codewords',   # 전체 데이터 코드워드 개수
+    'total_codewords',  # 전체 코드워드 개수 (데이터 + 오류 정정)
+    'blocks',           # 블록별 데이터 코드워드 (시작, 끝) 위치 tuple
+    'encoder',          # 블록마다 같은 개수의 오류 정정 코드워드를 만드는 RS 인코더
+    'interleave',       # (블록 순서로 이은 데이터 + 오류 정정 코드워드) -> 섞은 코드워드 tuple 함수
+    'remainder_bits',   # 코드워드를 배치하고 남는 데이터 칸 수
+    'placement',        # 데이터 비트를 템플릿에 배치하는 gather 함수 (layout.get_placement)
+))):
+    '''
+    (버전, 오류 정정 레벨)별로 캐시되는 변경 불가능한 블록 구성 계획
+    '''
+    __slots__ = ()
+
+    @property
+    def data_bits(self):
+        '''
+        :return: 데이터로 채울 수 있는 비트 수
+        '''
+        return self.data_codewords * 8
+
+    def add_error_correction(self, codewords):
+        '''
+        블록마다 오류 정정 코드워드를 만들고 데이터와 함께 섞는 함수
+        :param codewords: 패딩까지 끝난 데이터 코드워드 bytes
+        :return: 섞은 최종 코드워드 bytearray
+        '''
+        remainder = self.encoder.remainder
+        error_code = [remainder(codewords[start:end]) for start, end in self.blocks]
+        combined = codewords + bytes(itertools.chain.from_iterable(error_code))
+        return bytearray(self.interleave(combined))
+
+@lru_cache(maxsize=None)
+def get_block_plan(version, ecc_level):
+    '''
+    버전, 오류 정정 레벨의 블록 구성 계획을 만드는 함수 (조합마다 한 번만 생성)
+    :param version: qr코드 버전
+    :param ecc_level: qr코드 오류 정정 레벨
+    :return: BlockPlan
+    '''
+    # 정의된 블록 정보를 블록마다 (전체, 데이터) 코드워드 개수로 펼치기
+    error_block_size = constants.ERROR_BLOCK_TABLE[ecc_level][version - 1]
+    block_sizes = []
+    for i in range(0, len(error_block_size), 4):
+        block_count, total_count, data_count, _ = error_block_size[i:i + 4]
+        block_sizes += [(total_count, data_count)] * block_count
+    error_count = block_sizes[0][0] - block_sizes[0][1]
+
+    # 블록별 데이터 코드워드 경계
+    blocks = []
+    start = 0
+    for _, data_count in block_sizes:
+        blocks.append((start, start + data_count))
+        start += data_count
+    data_codewords = start
+
+    # 데이터 코드워드를 블록마다 앞 바이트부터 번갈아 가며, 그 다음 오류 정정 코드워드를 같은 방식으로 섞는 순서
+    order = []
+    for i in range(max(data_count for _, data_count in block_sizes)):
+        for start, end in blocks:
+            if start + i < end:
+                order.append(start + i)
+    for i in range(error_count):
+        for block in range(len(blocks)):
+            order.append(data_codewords + block * error_count + i)
+
+    total_codewords = len(order)
+    return BlockPlan(
+        version=version,
+        ecc_level=ecc_level,
+        data_codewords=data_codewords,
+        total_codewords=total_codewords,
+        blocks=tuple(blocks),
+        encoder=reed_solomon.get_encoder(error_count),
+        interleave=itemgetter(*order),
+        remainder_bits=len(layout.get_data_path(version)) - total_codewords * 8,
+        placement=layout.get_placement(version),
+    )
@@ -0,0 +1,160 @@
+import threading
+from collections import OrderedDict
+
+import qrcode.constants as constants
+from qrcode.qrcode import QRCode
+
+'''
+완성된 qr코드를 메모리에 보관하는 LRU 캐시 모듈
+항목 개수와 전체 바이트 수로 크기를 제한하고, 가장 오래 사용하지 않은 항목부터 지운다
+여러 스레드에서 같이 사용해도 안전하다
+'''
+
+def get_size(value):
+    '''
+    캐시 항목의 대략적인 메모리 크기를 구하는 함수
+    :param value: bytes 또는 QRCode
+    :return: 바이트 수
+    '''
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    # QRCode는 2darray의 모듈당 포인터 8바이트로 계산
+    return value.module_count * value.module_count * 8
+
+class SymbolCache(object):
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        '''
+        :param max_entries: 최대 항목 개수
+        :param max_bytes: 최대 전체 바이트 수
+        '''
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        '''
+        캐시에서 값을 가져오는 함수
+        :param key: 캐시 키
+        :return: 값 (없으면 None)
+        '''
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # 최근 사용한 항목으로 이동
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        '''
+        캐시에 값을 넣는 함수 (크기 제한을 넘으면 오래된 항목부터 삭제)
+        :param key: 캐시 키
+        :param value: bytes 또는 QRCode
+        '''
+        size = get_size(value)
+        # 혼자서 크기 제한을 넘는 값은 보관하지 않음
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_create(self, key, factory):
+        '''
+        캐시에 값이 없으면 factory로 만들어서 넣는 함수
+        생성은 lock 밖에서 하므로 같은 키를 동시에 요청하면 두 번 만들어질 수 있다
+        :param key: 캐시 키
+        :param factory: 값을 만드는 함수
+        :return: 값
+        '''
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        '''
+        캐시를 비우는 함수 (통계는 유지)
+        '''
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        '''
+        :return: 캐시 통계 dict
+        '''
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / requests if requests else 0.0,
+            }
+
+def get_key(data, ecc_level, version=None, mask_bit=None, *render_options):
+    '''
+    캐시 키를 만드는 함수
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param version: 고정한 qr코드 버전
+    :param mask_bit: 고정한 마스크 비트
+    :param render_options: 출력 옵션 (형식, 모듈 크기, 여백)
+    :return: 캐시 키 tuple
+    '''
+    return (data.encode('utf-8'), ecc_level, version, mask_bit) + render_options
+
+def get_qrcode(cache, data, ecc_level=constants.ERROR_LEVEL_M, version=None, mask_bit=None):
+    '''
+    캐시를 거쳐서 QRCode를 가져오는 함수
+    :param cache: SymbolCache
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param version: 고정할 qr코드 버전
+    :param mask_bit: 고정할 마스크 비트
+    :return: QRCode (캐시에 있던 객체는 여러 곳에서 같이 사용하므로 수정하지 말 것)
+    '''
+    return cache.get_or_create(
+        get_key(data, ecc_level, version, mask_bit),
+        lambda: QRCode(data, ecc_level, version, mask_bit)
+    )
+
+def render(cache, data, ecc_level=constants.ERROR_LEVEL_M, fmt='png', box_size=4, border=4,
+           version=None, mask_bit=None):
+    '''
+    캐시를 거쳐서 qr코드 이미지 bytes를 가져오는 함수
+    :param cache: SymbolCache
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param fmt: 출력 형식 (png, svg, pdf, eps)
+    :param box_size: 모듈 하나의 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :param version: 고정할 qr코드 버전
+    :param mask_bit: 고정할 마스크 비트
+    :return: 이미지 bytes
+    '''
+    return cache.get_or_create(
+        get_key(data, ecc_level, version, mask_bit, fmt, box_size, border),
+        lambda: QRCode(data, ecc_level, version, mask_bit).to_bytes(fmt, box_size, border)
+    )
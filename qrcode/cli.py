@@ -0,0 +1,129 @@
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+import qrcode.constants as constants
+import qrcode.pipeline as pipeline
+import qrcode.timing as timing
+from qrcode.qrcode import QRCode
+
+'''
+qrcode 명령어
+데이터 하나로 qr코드 하나를 만들거나 CSV/JSONL 파일로 여러 개를 한 번에 만든다
+
+  qrcode "https://example.com" -o example.png
+  qrcode --input urls.csv --field url -o codes.zip --jobs 8 --format svg
+'''
+
+def get_int_type(minimum):
+    '''
+    minimum 이상의 정수만 받는 argparse type 함수를 만드는 함수
+    '''
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'정수가 아닙니다: {text}')
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f'{minimum} 이상이어야 합니다: {value}')
+        return value
+    return parse
+
+def get_parser():
+    parser = argparse.ArgumentParser(prog='qrcode', description='QRCode 생성기')
+    parser.add_argument('data', nargs='?', help='qr코드로 만들 데이터 (--input 이 없을 때)')
+    parser.add_argument('-o', '--output', help='출력 파일/폴더 (.zip, .tar, .tar.gz, - 는 stdout)')
+    parser.add_argument('-i', '--input', help='여러 개를 만들 CSV/JSONL 파일 (- 는 stdin)')
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'), help='입력 형식 (기본값은 확장자로 판단)')
+    parser.add_argument('--field', help='데이터 열 이름/번호 또는 JSONL 키')
+    parser.add_argument('--name-field', help='파일 이름으로 쓸 열 이름/번호 또는 JSONL 키')
+    parser.add_argument('--no-header', dest='header', action='store_false',
+                        help='CSV 첫 줄도 데이터로 사용 (열은 번호로만 지정)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='생성 프로세스 수 (기본값은 CPU 개수)')
+    parser.add_argument('-f', '--format', choices=constants.OUTPUT_FORMATS,
+                        help='출력 형식 (기본값은 출력 파일 확장자, 없으면 png)')
+    parser.add_argument('-s', '--scale', type=get_int_type(1), default=4, help='모듈 하나의 크기 (기본값 4)')
+    parser.add_argument('-b', '--border', type=get_int_type(0), default=4, help='바깥 여백 모듈 개수 (기본값 4)')
+    parser.add_argument('-e', '--ecc', choices=('L', 'M', 'Q', 'H'), default=constants.ERROR_LEVEL_M,
+                        help='오류 정정 레벨 (기본값 M)')
+    parser.add_argument('-v', '--version', type=int, choices=range(1, 41), metavar='1-40',
+                        help='고정할 qr코드 버전 (기본값은 데이터가 들어가는 최소 버전)')
+    parser.add_argument('--profile', action='store_true',
+                        help='단계별 소요 시간 출력')
+    parser.add_argument('-q', '--quiet', action='store_true', help='진행 상황과 요약을 출력하지 않음')
+    return parser
+
+def get_format(args):
+    '''
+    출력 형식 결정 (옵션 -> 출력 파일 확장자 -> png)
+    '''
+    if args.format:
+        return args.format
+    extension = os.path.splitext(args.output or '')[1].lower().lstrip('.')
+    return extension if extension in constants.OUTPUT_FORMATS else 'png'
+
+def run_single(args, fmt):
+    start = time.perf_counter()
+    qrcode = QRCode(args.data, args.ecc, args.version)
+    image = qrcode.to_bytes(fmt, args.scale, args.border)
+    if args.output is None or args.output == '-':
+        sys.stdout.buffer.write(image)
+    else:
+        with open(args.output, 'wb') as file:
+            file.write(image)
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        print(f'version {qrcode.version}, ecc {qrcode.ecc_level}, mask {qrcode.mask_bit}, '
+              f'{len(image)} bytes in {elapsed * 1000:.1f} ms', file=sys.stderr)
+
+def run_batch(args, fmt):
+    last_report = [time.perf_counter()]
+
+    def progress(stats):
+        # 1초마다 진행 상황 출력
+        now = time.perf_counter()
+        if now - last_report[0] >= 1:
+            last_report[0] = now
+            elapsed = now - stats.start
+            print(f'\r{stats.count} codes, {stats.count / elapsed:.1f} codes/s', end='', file=sys.stderr)
+
+    stats = pipeline.run_pipeline(
+        args.input, args.output, args.input_format, args.field, args.name_field, args.header,
+        args.ecc, fmt, args.scale, args.border, args.version,
+        workers=args.jobs,
+        report=None,
+        progress=None if args.quiet else progress
+    )
+    if not args.quiet:
+        # 진행 상황 줄을 지우고 요약 출력
+        print('\r\033[K' + stats.summary(), file=sys.stderr)
+
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if args.input is None and args.data is None:
+        parser.error('데이터 또는 --input 이 필요합니다.')
+    if args.input is not None and args.output is None:
+        parser.error('--input 을 사용할 때는 --output 이 필요합니다.')
+    fmt = get_format(args)
+
+    # --profile 이면 만드는 모든 qr코드의 단계별 시간 측정
+    timings = timing.StageTimings() if args.profile else None
+    try:
+        with timing.collect(timings) if timings is not None else contextlib.nullcontext():
+            if args.input is not None:
+                run_batch(args, fmt)
+            else:
+                run_single(args, fmt)
+    except ValueError as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 1
+    finally:
+        if timings is not None:
+            print(timings.summary(), file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
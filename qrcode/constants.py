@@ -1,5 +1,3 @@
-import csv
-
 ERROR_BLOCK_TABLE = {
     'L': [
         (1, 26, 19, 2),
@@ -171,23 +169,34 @@ ERROR_BLOCK_TABLE = {
     ]
 }
 
+# 오류 정정 레벨별, 버전별 최대 저장 가능 데이터 비트 수 (size.csv와 같은 값)
 QRCODE_CAPACITY = {
-    'L': [],
-    'M': [],
-    'Q': [],
-    'H': []
+    'L': [
+        152, 272, 440, 640, 864, 1088, 1248, 1552, 1856, 2192,
+        2592, 2960, 3424, 3688, 4184, 4712, 5176, 5768, 6360, 6888,
+        7456, 8048, 8752, 9392, 10208, 10960, 11744, 12248, 13048, 13880,
+        14744, 15640, 16568, 17528, 18448, 19472, 20528, 21616, 22496, 23648,
+    ],
+    'M': [
+        128, 224, 352, 512, 688, 864, 992, 1232, 1456, 1728,
+        2032, 2320, 2672, 2920, 3320, 3624, 4056, 4504, 5016, 5352,
+        5712, 6256, 6880, 7312, 8000, 8496, 9024, 9544, 10136, 10984,
+        11640, 12328, 13048, 13800, 14496, 15312, 15936, 16816, 17728, 18672,
+    ],
+    'Q': [
+        104, 176, 272, 384, 496, 608, 704, 880, 1056, 1232,
+        1440, 1648, 1952, 2088, 2360, 2600, 2936, 3176, 3560, 3880,
+        4096, 4544, 4912, 5312, 5744, 6032, 6464, 6968, 7288, 7880,
+        8264, 8920, 9368, 9848, 10288, 10832, 11408, 12016, 12656, 13328,
+    ],
+    'H': [
+        72, 128, 208, 288, 368, 480, 528, 688, 800, 976,
+        1120, 1264, 1440, 1576, 1784, 2024, 2264, 2504, 2728, 3080,
+        3248, 3536, 3712, 4112, 4304, 4768, 5024, 5288, 5608, 5960,
+        6344, 6760, 7208, 7688, 7888, 8432, 8768, 9136, 9776, 10208,
+    ],
 }
 
-with open('size.csv', mode='r') as file:
-    reader = csv.reader(file)
-    attrs = []
-    for row in reader:
-        if len(attrs) < 1:
-            attrs = row
-            continue
-        for key, value in zip(attrs, row):
-            QRCODE_CAPACITY[key].append(int(value))
-
 ALIGN_PATTERN_POSITION = [
     [],
     [6, 18],
@@ -250,6 +259,13 @@ ERROR_LEVEL_BITS = {
     'H': '10'
 }
 
+# 포맷 정보 BCH(15, 5) 생성 다항식
+FORMAT_GENERATOR = [1, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]
+# 포맷 정보에 XOR 하는 마스크
+FORMAT_MASK = 0b101010000010010
+# 버전 정보 BCH(18, 6) 생성 다항식
+VERSION_GENERATOR = [1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 0, 1]
+
 ERROR_LEVEL_L = 'L'
 ERROR_LEVEL_M = 'M'
 ERROR_LEVEL_Q = 'Q'
@@ -260,3 +276,12 @@ MODE_BITS = {
     'Alphanumeric': '0010',
     'Byte': '0100'
 }
+
+# Alphanumeric 모드 문자 (문자 위치가 인코딩 값)
+ALPHANUMERIC_CHARS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:'
+
+# 여러 모드를 섞어서 인코딩했을 때의 모드 이름
+MODE_MIXED = 'Mixed'
+
+# 지원하는 출력 형식 (QRCode.save_<형식> 함수)
+OUTPUT_FORMATS = ('png', 'svg', 'pdf', 'eps')
@@ -0,0 +1,234 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+import qrcode.constants as constants
+from qrcode.qrcode import QRCode
+
+'''
+디스크에 qr코드 이미지를 보관하는 캐시 모듈
+데이터, ecc level, 출력 옵션의 해시를 파일 이름으로 사용하고 (content-addressed)
+해시 앞 두 글자로 나눈 하위 폴더에 저장한다
+임시 파일에 쓴 뒤 rename으로 옮기므로 여러 프로세스/호스트가 동시에 써도 깨진 파일을 읽지 않는다
+일정량을 쓸 때마다 백그라운드 스레드에서 오래된 항목을 정리한다
+'''
+
+# 출력 결과가 바뀌면 올려서 이전 캐시 항목을 쓰지 않도록 하는 키 버전
+KEY_VERSION = 2
+# 캐시 파일 권한 (다른 사용자로 실행되는 호스트도 읽을 수 있도록)
+FILE_MODE = 0o644
+
+class DiskCache(object):
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024, max_age=None, evict_every=1000):
+        '''
+        :param directory: 캐시 폴더
+        :param max_bytes: 캐시 폴더의 최대 전체 바이트 수
+        :param max_age: 항목을 보관할 최대 시간 (초, None이면 제한 없음)
+        :param evict_every: put 이 횟수만큼 (또는 max_bytes의 1/10 만큼) 쓸 때마다
+                            백그라운드 스레드에서 evict 실행 (None이면 자동 정리 안 함)
+        '''
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # 마지막 정리 이후 쓴 횟수와 바이트 수
+        self.writes = 0
+        self.written_bytes = 0
+        # 실행 중인 백그라운드 정리 스레드 (없으면 None)
+        self.evict_thread = None
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key):
+        '''
+        캐시 키에 해당하는 파일 경로를 구하는 함수
+        :param key: 캐시 키 (str 또는 tuple)
+        :return: 파일 경로
+        '''
+        digest = hashlib.sha256(repr((KEY_VERSION, key)).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key):
+        '''
+        캐시에서 값을 읽는 함수
+        :param key: 캐시 키
+        :return: bytes (없거나 만료되었으면 None)
+        '''
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as file:
+                if self.max_age is not None and time.time() - os.fstat(file.fileno()).st_mtime > self.max_age:
+                    value = None
+                else:
+                    value = file.read()
+        except OSError:
+            # 없는 파일, 읽을 수 없는 파일(권한, 다른 호스트가 지우는 중 등)은 없는 것으로 처리
+            value = None
+        with self.lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is not None:
+            # 최근 사용 시간 갱신 (용량 정리 시 오래 안 쓴 항목부터 삭제)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def put(self, key, value):
+        '''
+        캐시에 값을 쓰는 함수 (임시 파일에 쓰고 rename으로 교체)
+        :param key: 캐시 키
+        :param value: bytes
+        '''
+        path = self.get_path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            # mkstemp는 0600으로 만들므로 다른 사용자도 읽을 수 있게 변경
+            os.fchmod(fd, FILE_MODE)
+            with os.fdopen(fd, 'wb') as file:
+                file.write(value)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        self.__count_write__(len(value))
+
+    def __count_write__(self, size):
+        '''
+        쓴 횟수/바이트 수를 더하고 정리할 때가 되면 백그라운드 정리 스레드를 시작하는 함수
+        (폴더 전체를 훑는 정리가 put을 부른 스레드를 막지 않도록 하고, 한 번에 하나만 실행)
+        :param size: 이번에 쓴 바이트 수
+        '''
+        if self.evict_every is None:
+            return
+        with self.lock:
+            self.writes += 1
+            self.written_bytes += size
+            if self.evict_thread is not None or \
+                    (self.writes < self.evict_every and self.written_bytes < self.max_bytes // 10):
+                return
+            self.writes = 0
+            self.written_bytes = 0
+            self.evict_thread = threading.Thread(target=self.__evict_in_background__, name='qrcode-disk-cache-evict',
+                                                 daemon=True)
+            self.evict_thread.start()
+
+    def __evict_in_background__(self):
+        try:
+            self.evict()
+        except OSError:
+            # 다른 호스트가 폴더를 정리하는 중 등 (다음 정리에서 다시 시도)
+            pass
+        finally:
+            with self.lock:
+                self.evict_thread = None
+
+    def wait_for_eviction(self, timeout=None):
+        '''
+        실행 중인 백그라운드 정리가 끝날 때까지 기다리는 함수
+        :param timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+        '''
+        thread = self.evict_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def get_or_create(self, key, factory):
+        '''
+        캐시에 값이 없으면 factory로 만들어서 쓰는 함수
+        :param key: 캐시 키
+        :param factory: bytes를 만드는 함수
+        :return: bytes
+        '''
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def evict(self):
+        '''
+        만료된 항목을 지우고, 최대 크기를 넘으면 오래 사용하지 않은 항목부터 지우는 함수
+        :return: 지운 항목 개수
+        '''
+        now = time.time()
+        entries = []
+        removed = 0
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                # 만료된 항목과 오래된 임시 파일 삭제
+                expired = self.max_age is not None and now - stat.st_mtime > self.max_age
+                stale = entry.name.startswith('.tmp-') and now - stat.st_mtime > 3600
+                if expired or stale:
+                    removed += self.__remove__(entry.path)
+                elif not entry.name.startswith('.tmp-'):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            removed += self.__remove__(path)
+            total_bytes -= size
+        with self.lock:
+            self.evictions += removed
+        return removed
+
+    def __remove__(self, path):
+        try:
+            os.remove(path)
+            return 1
+        except FileNotFoundError:
+            # 다른 프로세스가 먼저 지운 경우
+            return 0
+
+    def stats(self):
+        '''
+        :return: 캐시 통계 dict (이 객체에서 조회한 기록 기준)
+        '''
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / requests if requests else 0.0,
+            }
+
+def render(cache, data, ecc_level=constants.ERROR_LEVEL_M, fmt='png', box_size=4, border=4,
+           version=None, mask_bit=None):
+    '''
+    디스크 캐시를 거쳐서 qr코드 이미지 bytes를 가져오는 함수
+    :param cache: DiskCache
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param fmt: 출력 형식 (png, svg, pdf, eps)
+    :param box_size: 모듈 하나의 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :param version: 고정할 qr코드 버전
+    :param mask_bit: 고정할 마스크 비트
+    :return: 이미지 bytes
+    '''
+    return cache.get_or_create(
+        (data, ecc_level, version, mask_bit, fmt, box_size, border),
+        lambda: QRCode(data, ecc_level, version, mask_bit).to_bytes(fmt, box_size, border)
+    )
@@ -0,0 +1,302 @@
+from array import array
+from functools import lru_cache
+from operator import itemgetter
+
+import error_correction.bch as bch
+import qrcode.constants as constants
+
+'''
+버전별 qr코드 배치 정보
+파인더/정렬/타이밍 패턴, 버전 정보처럼 데이터와 무관하고 버전에만 의존하는 부분을
+버전마다 한 번만 만들어서 재사용한다
+'''
+
+def get_module_count(version):
+    '''
+    버전별 한 변의 모듈 개수를 구하는 함수
+    :param version: qr코드 버전
+    :return: 모듈 개수
+    '''
+    return version * 4 + 17
+
+def add_finder_pattern(modules, module_count, start_x, start_y):
+    '''
+    파인더 패턴을 추가하는 함수
+    :param modules: qr코드 2darray
+    :param module_count: 모듈 개수
+    :param start_x: 가로 시작 위치
+    :param start_y: 세로 시작 위치
+    '''
+    # 파인더 패턴 바깥 분리자 추가
+    for i in range(start_y - 1, start_y + 8):
+        for j in range(start_x - 1, start_x + 8):
+            if 0 <= i < module_count and 0 <= j < module_count:
+                if i == start_y - 1 or i == start_y + 7:
+                    modules[i][j] = 0
+                elif j == start_x - 1 or j == start_x + 7:
+                    modules[i][j] = 0
+    # 7x7 검정색 패턴 추가
+    for i in range(start_y, start_y + 7):
+        for j in range(start_x, start_x + 7):
+            if i == start_y or i == start_y + 6:
+                modules[i][j] = 1
+            elif j == start_x or j == start_x + 6:
+                modules[i][j] = 1
+    # 6x6 흰색 패턴 추가
+    for i in range(start_y + 1, start_y + 6):
+        for j in range(start_x + 1, start_x + 6):
+            if i == start_y + 1 or i == start_y + 5:
+                modules[i][j] = 0
+            elif j == start_x + 1 or j == start_x + 5:
+                modules[i][j] = 0
+    # 5x5 검정색 패턴 추가
+    for i in range(start_y + 2, start_y + 5):
+        for j in range(start_x + 2, start_x + 5):
+            modules[i][j] = 1
+
+def add_align_pattern(modules, version):
+    '''
+    정렬 패턴을 추가하는 함수
+    :param modules: qr코드 2darray
+    :param version: qr코드 버전
+    '''
+    # 사전 정의된 버전별 정렬 패턴 위치 가져오기
+    pos = constants.ALIGN_PATTERN_POSITION[version - 1]
+    # 정렬 패턴 추가
+    for i in range(len(pos)):
+        row = pos[i]
+        for j in range(len(pos)):
+            col = pos[j]
+            if modules[row][col] != 2:
+                continue
+            for r in range(-2, 3):
+                for c in range(-2, 3):
+                    if r == -2 or r == 2 or c == -2 or c == 2 or (r == 0 and c == 0):
+                        modules[row + r][col + c] = 1
+                    else:
+                        modules[row + r][col + c] = 0
+
+def add_timing_pattern(modules, module_count):
+    '''
+    타이밍 패턴을 추가하는 함수
+    :param modules: qr코드 2darray
+    :param module_count: 모듈 개수
+    '''
+    # 세로 타이밍 패턴 추가
+    for i in range(8, module_count - 8):
+        if modules[i][6] != 2: continue
+        modules[i][6] = int(i % 2 == 0)
+    # 가로 타이밍 패턴 추가
+    for i in range(8, module_count - 8):
+        if modules[6][i] != 2: continue
+        modules[6][i] = int(i % 2 == 0)
+
+@lru_cache(maxsize=None)
+def get_version_information(version):
+    '''
+    버전 정보 18비트를 구하는 함수 (버전마다 한 번만 bch 계산)
+    :param version: qr코드 버전 (7 이상)
+    :return: 버전 정보 비트 정수
+    '''
+    # 버전 수 6비트 + bch 알고리즘으로 계산한 에러 정정 비트 12개
+    version_information = int(format(version, '06b') + bch.bch_encode(version, 18, 6, constants.VERSION_GENERATOR), 2)
+    return version_information
+
+def add_version_information(modules, version):
+    '''
+    버전 정보를 추가하는 함수
+    :param modules: qr코드 2darray
+    :param version: qr코드 버전
+    '''
+    module_count = get_module_count(version)
+    version_information = get_version_information(version)
+    # 좌측 하단 파인더 패턴 위와 우측 상단 파인더 패턴 왼쪽에 버전 정보 추가 (최하위 비트부터)
+    bits_idx = 0
+    for i in range(0, 6):
+        for j in range(module_count - 11, module_count - 8):
+            modules[j][i] = modules[i][j] = (version_information >> bits_idx) & 1
+            bits_idx += 1
+
+def get_format_positions(module_count):
+    '''
+    포맷 정보 비트가 들어갈 위치를 구하는 함수
+    :param module_count: 모듈 개수
+    :return: 포맷 정보 최하위 비트부터 순서대로 (y, x) 위치를 담은 두 벌의 리스트
+    '''
+    # 좌측 상단 파인더 패턴 오른쪽, 아래
+    first = [(i, 8) for i in range(0, 9) if i != 6] + [(8, i) for i in range(7, -1, -1) if i != 6]
+    # 우측 상단 파인더 패턴 아래, 좌측 하단 파인더 패턴 오른쪽
+    second = ([(8, i) for i in range(module_count - 1, module_count - 8, -1)] +
+              [(i, 8) for i in range(module_count - 8, module_count)])
+    return first, second
+
+def reserve_format_area(modules, module_count):
+    '''
+    포맷 정보가 들어갈 자리를 데이터 영역에서 제외하는 함수
+    실제 포맷 비트는 마스크마다 다르므로 나중에 채운다
+    :param modules: qr코드 2darray
+    :param module_count: 모듈 개수
+    '''
+    for positions in get_format_positions(module_count):
+        for y, x in positions:
+            modules[y][x] = 0
+    # 항상 검정색인 모듈
+    modules[8][module_count - 8] = 1
+
+@lru_cache(maxsize=None)
+def get_format_information(ecc_level, mask_bit):
+    '''
+    포맷 정보 15비트를 구하는 함수 (ecc level, 마스크 조합마다 한 번만 bch 계산)
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param mask_bit: 마스크 비트
+    :return: 마스크까지 적용된 포맷 정보 비트 정수
+    '''
+    # ecc level 비트 + 마스크 비트 = 포맷 비트
+    format_bit = constants.ERROR_LEVEL_BITS[ecc_level] + mask_bit
+    # 포맷 비트에 에러 정정 비트 추가
+    format_information = int(format_bit + bch.bch_encode(int(format_bit, 2), 15, 5, constants.FORMAT_GENERATOR), 2)
+    # 포맷 비트에 XOR 연산으로 마스크 적용
+    return format_information ^ constants.FORMAT_MASK
+
+@lru_cache(maxsize=None)
+def get_format_plane(version, ecc_level, mask_bit):
+    '''
+    포맷 정보를 찍을 비트 평면을 만드는 함수 (조합마다 한 번만 생성)
+    템플릿의 포맷 자리는 0이므로 OR 연산으로 바로 적용할 수 있다
+    :param version: qr코드 버전
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param mask_bit: 마스크 비트
+    :return: 행 순서로 펼친 bytes를 big-endian 정수로 바꾼 값
+    '''
+    module_count = get_module_count(version)
+    format_information = get_format_information(ecc_level, mask_bit)
+    plane = bytearray(module_count * module_count)
+    for positions in get_format_positions(module_count):
+        for bit_idx, (y, x) in enumerate(positions):
+            plane[y * module_count + x] = (format_information >> bit_idx) & 1
+    return int.from_bytes(plane, 'big')
+
+@lru_cache(maxsize=None)
+def get_template(version):
+    '''
+    버전별 기능 패턴 템플릿을 만드는 함수 (버전마다 한 번만 생성)
+    기능 패턴/예약 영역은 0 또는 1, 데이터가 들어갈 칸은 2
+    :param version: qr코드 버전
+    :return: 행 순서로 펼친 모듈 값 bytes
+    '''
+    module_count = get_module_count(version)
+    # qr코드를 표현할 2darray
+    modules = [[2] * module_count for _ in range(module_count)]
+    # 좌측 상단 파이더 패턴 추가
+    add_finder_pattern(modules, module_count, 0, 0)
+    # 우측 상단 파인더 패턴 추가
+    add_finder_pattern(modules, module_count, module_count - 7, 0)
+    # 좌측 하단 파인더 패턴 추가
+    add_finder_pattern(modules, module_count, 0, module_count - 7)
+    # 정렬 패턴 추가
+    add_align_pattern(modules, version)
+    # 타이밍 패턴 추가
+    add_timing_pattern(modules, module_count)
+    # 포맷 정보 자리 예약
+    reserve_format_area(modules, module_count)
+
+    # qr코드의 버전이 7 이상이면 버전 정보 추가
+    if version >= 7:
+        add_version_information(modules, version)
+
+    return bytes(m for row in modules for m in row)
+
+@lru_cache(maxsize=None)
+def get_data_path(version):
+    '''
+    데이터 모듈을 채우는 지그재그 순서를 계산하는 함수 (버전마다 한 번만 생성)
+    :param version: qr코드 버전
+    :return: 배치 순서대로 나열한 데이터 모듈의 펼친 위치(y * 모듈 개수 + x) array
+    '''
+    module_count = get_module_count(version)
+    template = get_template(version)
+    path = array('I')
+
+    # 세로 이동 방향
+    direction_y = -1
+    # qr코드 가로 위치
+    x = module_count - 1
+    # qr코드 세로 위치
+    y = module_count - 1
+
+    # 모든 칸을 순회
+    while True:
+        # 아무 데이터도 없는 칸이라면 배치 순서에 추가
+        if template[y * module_count + x] == 2:
+            path.append(y * module_count + x)
+
+        # 데이터가 들어갈 수 있는 마지막 칸에 도달하면 break
+        if x == 0 and y == module_count - 9:
+            break
+
+        # 규칙에 따라 칸을 순회하도록 설정
+        if (x % 2 == 0) ^ (x <= 6):
+            x -= 1
+        else:
+            x += 1
+            y += direction_y
+            if y < 0:
+                direction_y = 1
+                y = 0
+                x -= 2
+            elif y >= module_count:
+                direction_y = -1
+                y = module_count - 1
+                x -= 2
+        if x == 6:
+            x -= 1
+
+    return path
+
+@lru_cache(maxsize=None)
+def get_placement(version):
+    '''
+    데이터 비트를 템플릿에 배치하는 gather 함수를 만드는 함수 (버전마다 한 번만 생성)
+    배치 순서의 비트들 뒤에 템플릿을 이어 붙인 값에서 모듈마다 가져올 위치를 미리 계산해 둔다
+    :param version: qr코드 버전
+    :return: (배치 순서대로 나열한 0/1 비트 bytes + 템플릿) -> 행 순서로 펼친 모듈 값 tuple 함수
+    '''
+    template = get_template(version)
+    path = get_data_path(version)
+    # 데이터가 아닌 칸은 템플릿 값, 데이터 칸은 배치 순서의 비트 위치
+    sources = list(range(len(path), len(path) + len(template)))
+    for order, idx in enumerate(path):
+        sources[idx] = order
+    return itemgetter(*sources)
+
+@lru_cache(maxsize=None)
+def get_mask_planes(version):
+    '''
+    버전별 8개 마스크의 비트 평면을 만드는 함수 (버전마다 한 번만 생성)
+    constants.MASK_FUNCTION을 기준 정의로 사용해서 데이터 모듈 중 반전할 칸만 1로 표시한다
+    :param version: qr코드 버전
+    :return: 마스크 비트 -> 행 순서로 펼친 bytes를 big-endian 정수로 바꾼 값
+    '''
+    module_count = get_module_count(version)
+    path = get_data_path(version)
+    planes = {}
+    for mask_bit in constants.MASK_BITS:
+        mask_func = constants.MASK_FUNCTION[mask_bit]
+        plane = bytearray(module_count * module_count)
+        for idx in path:
+            y, x = divmod(idx, module_count)
+            if mask_func(y, x):
+                plane[idx] = 1
+        planes[mask_bit] = int.from_bytes(plane, 'big')
+    return planes
+
+def warm_up(versions=range(1, 41)):
+    '''
+    버전별 캐시(템플릿, 배치 순서, 배치 gather, 마스크 비트 평면)를 미리 만들어 두는 함수
+    :param versions: 미리 준비할 qr코드 버전 목록
+    '''
+    for version in versions:
+        get_template(version)
+        get_data_path(version)
+        get_placement(version)
+        get_mask_planes(version)
@@ -0,0 +1,241 @@
+import os
+import tempfile
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import qrcode.timing as timing
+
+'''
+qr코드 생성 지표를 Prometheus text 형식으로 내보내는 모듈
+Metrics는 timing.StageTimings 와 같은 collector라서 timing.collect(metrics) 안에서 만드는
+qr코드의 버전/ecc level/모드별 생성 시간, 출력 형식별 출력 시간, 데이터 길이 분포를 모은다
+결과는 render()로 문자열을 만들거나 write()로 파일(node_exporter textfile collector 등)에 저장하거나
+serve()로 로컬 HTTP(/metrics)에서 제공한다
+
+  metrics = Metrics()
+  metrics.track_cache('memory', symbol_cache)
+  metrics.serve(9464)
+  with timing.collect(metrics):
+      ...
+'''
+
+# 생성/출력 시간 histogram 구간 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# 데이터 길이 histogram 구간 (문자/바이트 수)
+PAYLOAD_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+# Prometheus text 형식 content type
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def format_labels(names, values):
+    '''
+    label 이름과 값으로 {name="value",...} 문자열을 만드는 함수
+    '''
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+def format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+class Histogram(object):
+    '''
+    label 값 조합별 누적 구간 개수, 합계, 개수를 보관하는 histogram
+    '''
+    def __init__(self, name, description, label_names, buckets):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        # label 값 tuple -> [구간별 개수..., 전체 개수, 합계]
+        self.series = {}
+
+    def observe(self, labels, value):
+        '''
+        값 하나를 기록하는 함수
+        :param labels: label 값 tuple
+        :param value: 기록할 값
+        '''
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += 1
+        series[-1] += value
+
+    def merge(self, other):
+        for labels, values in other.series.items():
+            series = self.series.setdefault(labels, [0] * (len(self.buckets) + 1) + [0.0])
+            for i, value in enumerate(values):
+                series[i] += value
+
+    def clear(self):
+        self.series.clear()
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} histogram']
+        names = self.label_names + ('le',)
+        for labels, series in sorted(self.series.items()):
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{format_labels(names, labels + (bound,))} {count}')
+            lines.append(f'{self.name}_bucket{format_labels(names, labels + ("+Inf",))} {series[-2]}')
+            lines.append(f'{self.name}_sum{format_labels(self.label_names, labels)} {format_value(series[-1])}')
+            lines.append(f'{self.name}_count{format_labels(self.label_names, labels)} {series[-2]}')
+        return lines
+
+def render_counter(name, description, label_names, values, kind='counter'):
+    '''
+    label 값 tuple -> 값 dict를 Prometheus counter/gauge 형식으로 만드는 함수
+    '''
+    lines = [f'# HELP {name} {description}', f'# TYPE {name} {kind}']
+    for labels, value in sorted(values.items()):
+        lines.append(f'{name}{format_labels(label_names, labels)} {format_value(value)}')
+    return lines
+
+class Metrics(timing.StageTimings):
+    '''
+    단계별 시간과 함께 Prometheus 지표를 모으는 collector
+    '''
+    def __init__(self):
+        super().__init__()
+        self.symbols = Counter()
+        self.renders = Counter()
+        self.generation_seconds = Histogram(
+            'qrcode_generation_seconds', 'Time to build a QR code symbol (without rendering).',
+            ('version', 'ecc_level', 'mode'), LATENCY_BUCKETS)
+        self.render_seconds = Histogram(
+            'qrcode_render_seconds', 'Time to render a QR code symbol.', ('format',), LATENCY_BUCKETS)
+        self.payload_length = Histogram(
+            'qrcode_payload_length', 'Input length (characters, or bytes in Byte mode).',
+            ('mode', 'ecc_level'), PAYLOAD_BUCKETS)
+        # 캐시 이름 -> stats() 를 가진 캐시 객체
+        self.caches = {}
+
+    def __getstate__(self):
+        # 캐시 객체는 다른 프로세스로 보내지 않음
+        state = super().__getstate__()
+        state['caches'] = {}
+        return state
+
+    def add(self, record):
+        super().add(record)
+        with self.lock:
+            labels = (record.version, record.ecc_level, record.mode)
+            self.symbols[labels] += 1
+            self.generation_seconds.observe(labels, record.total)
+            self.payload_length.observe((record.mode, record.ecc_level), record.data_length)
+
+    def add_render(self, record, fmt, elapsed):
+        super().add_render(record, fmt, elapsed)
+        with self.lock:
+            self.renders[(fmt,)] += 1
+            self.render_seconds.observe((fmt,), elapsed)
+
+    def merge(self, other):
+        super().merge(other)
+        with self.lock:
+            self.symbols.update(other.symbols)
+            self.renders.update(other.renders)
+            self.generation_seconds.merge(other.generation_seconds)
+            self.render_seconds.merge(other.render_seconds)
+            self.payload_length.merge(other.payload_length)
+
+    def clear(self):
+        super().clear()
+        with self.lock:
+            self.symbols.clear()
+            self.renders.clear()
+            self.generation_seconds.clear()
+            self.render_seconds.clear()
+            self.payload_length.clear()
+
+    def track_cache(self, name, cache):
+        '''
+        내보낼 때 hits/misses/hit ratio를 함께 보여줄 캐시를 등록하는 함수
+        :param name: 캐시 이름 (cache label 값)
+        :param cache: stats() 가 hits, misses, hit_ratio를 돌려주는 캐시 (SymbolCache, DiskCache)
+        '''
+        self.caches[name] = cache
+
+    def render(self):
+        '''
+        모든 지표를 Prometheus text 형식 문자열로 만드는 함수
+        '''
+        # 캐시는 자체 lock을 쓰므로 먼저 조회
+        cache_stats = {(name,): cache.stats() for name, cache in self.caches.items()}
+        with self.lock:
+            lines = render_counter(
+                'qrcode_symbols_total', 'QR code symbols built.',
+                ('version', 'ecc_level', 'mode'), self.symbols)
+            lines += render_counter(
+                'qrcode_renders_total', 'QR code symbols rendered.', ('format',), self.renders)
+            lines += render_counter(
+                'qrcode_stage_seconds_total', 'Total time spent in each stage.',
+                ('stage',), {(stage,): total for stage, total in self.totals.items()})
+            lines += self.generation_seconds.render()
+            lines += self.render_seconds.render()
+            lines += self.payload_length.render()
+        if cache_stats:
+            for key, kind, description in (
+                ('hits', 'counter', 'Cache hits.'),
+                ('misses', 'counter', 'Cache misses.'),
+                ('evictions', 'counter', 'Cache evictions.'),
+                ('hit_ratio', 'gauge', 'Cache hit ratio.'),
+            ):
+                values = {name: stats[key] for name, stats in cache_stats.items() if key in stats}
+                if values:
+                    suffix = '_total' if kind == 'counter' else ''
+                    lines += render_counter(f'qrcode_cache_{key}{suffix}', description, ('cache',), values, kind)
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        '''
+        지표를 파일로 저장하는 함수 (읽는 쪽이 중간 상태를 보지 않도록 임시 파일로 쓰고 교체)
+        :param path: 저장할 파일 경로
+        '''
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+                file.write(self.render())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        '''
+        백그라운드 스레드에서 /metrics HTTP endpoint를 여는 함수
+        :param port: 포트 (0이면 빈 포트)
+        :param host: 주소 (기본값은 로컬에서만 접근 가능)
+        :return: ThreadingHTTPServer (shutdown()으로 종료)
+        '''
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='qrcode-metrics', daemon=True).start()
+        return server
@@ -0,0 +1,338 @@
+import collections
+import csv
+import io
+import json
+import os
+import queue
+import re
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+
+import qrcode.batch as batch
+import qrcode.constants as constants
+import qrcode.util as util
+
+'''
+CSV/JSONL 데이터를 읽어서 qr코드 이미지를 폴더, zip, tar로 저장하는 스트리밍 파이프라인
+읽기 -> 생성(프로세스 풀) -> 쓰기(별도 스레드) 단계가 제너레이터와 크기가 정해진 큐로 연결되어
+입력이 아무리 길어도 메모리 사용량이 일정하고, 쓰기가 느리면 생성도 기다린다
+'''
+
+# 파일 이름에 쓸 수 없는 문자
+UNSAFE_NAME = re.compile(r'[^0-9A-Za-z._-]')
+
+def open_source(source):
+    '''
+    입력 파일을 텍스트로 여는 함수
+    :param source: 파일 경로 또는 '-' (stdin) 또는 텍스트 파일 객체
+    :return: 텍스트 파일 객체
+    '''
+    if source == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    if hasattr(source, 'read'):
+        return source
+    return open(source, 'r', encoding='utf-8', newline='')
+
+def get_column(row, column):
+    '''
+    행에서 열 값을 꺼내는 함수 (없는 열이면 None)
+    :param row: dict (CSV 헤더 사용, JSONL) 또는 list (CSV 헤더 없음)
+    :param column: 열 이름 또는 번호
+    '''
+    if isinstance(row, dict):
+        return row.get(column)
+    if isinstance(row, list) and isinstance(column, int) and -len(row) <= column < len(row):
+        return row[column]
+    return None
+
+def get_header_column(fieldnames, column):
+    '''
+    헤더가 있는 CSV에서 열 번호를 열 이름으로 바꾸는 함수
+    :param fieldnames: 헤더 열 이름 리스트
+    :param column: 열 이름 또는 번호 (번호 string 포함)
+    :return: 열 이름
+    '''
+    if isinstance(column, str) and column.isdigit() and column not in fieldnames:
+        column = int(column)
+    if isinstance(column, int):
+        if not 0 <= column < len(fieldnames):
+            raise ValueError(f'CSV 헤더에 {column}번 열이 없습니다: {fieldnames}')
+        return fieldnames[column]
+    if column not in fieldnames:
+        raise ValueError(f'CSV 헤더에 {column} 열이 없습니다: {fieldnames}')
+    return column
+
+def parse_json_lines(file):
+    '''
+    JSONL 한 줄씩 읽는 제너레이터 (읽을 수 없는 줄은 None)
+    '''
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+def read_payloads(source, input_format=None, field=None, name_field=None, header=True):
+    '''
+    CSV/JSONL 입력에서 (이름, 데이터)를 한 줄씩 읽는 제너레이터
+    데이터 열이 없거나 문자열이 아닌 줄은 데이터를 None으로 돌려준다
+    :param source: 파일 경로 또는 '-' (stdin) 또는 텍스트 파일 객체
+    :param input_format: csv 또는 jsonl (None이면 확장자로 판단, 알 수 없으면 csv)
+    :param field: 데이터 열 (CSV는 열 이름 또는 번호, JSONL은 키, None이면 첫 번째 열 / 'data' 키)
+    :param name_field: 파일 이름으로 쓸 열 (None이면 줄 번호)
+    :param header: CSV 첫 줄이 헤더인지 여부 (False면 열 번호만 사용 가능)
+    :return: (이름, 데이터)
+    '''
+    if input_format is None:
+        extension = os.path.splitext(source)[1].lower() if isinstance(source, str) else ''
+        input_format = 'jsonl' if extension in ('.jsonl', '.ndjson', '.json') else 'csv'
+
+    file = open_source(source)
+    try:
+        if input_format == 'jsonl':
+            rows = parse_json_lines(file)
+            field = 'data' if field is None else field
+        elif header:
+            # 첫 줄을 헤더로 사용하고, 열 번호는 열 이름으로 바꿈 (데이터 열 기본값은 첫 번째 열)
+            rows = csv.DictReader(file)
+            fieldnames = rows.fieldnames or []
+            field = get_header_column(fieldnames, 0 if field is None else field)
+            if name_field is not None:
+                name_field = get_header_column(fieldnames, name_field)
+        else:
+            rows = csv.reader(file)
+            field = 0 if field is None else int(field)
+            name_field = None if name_field is None else int(name_field)
+
+        for index, row in enumerate(rows):
+            if isinstance(row, str):
+                # JSONL 한 줄이 문자열 하나인 경우
+                data, name = row, None
+            else:
+                data = get_column(row, field)
+                name = get_column(row, name_field) if name_field is not None else None
+            if not isinstance(data, str):
+                data = None
+            name = UNSAFE_NAME.sub('_', str(name)) if name not in (None, '') else f'{index:08d}'
+            yield name, data
+    finally:
+        if file is not source:
+            file.close()
+
+class DirectorySink(object):
+    '''
+    폴더에 파일로 저장
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, name, data):
+        with open(os.path.join(self.path, name), 'wb') as file:
+            file.write(data)
+
+    def close(self):
+        pass
+
+class ZipSink(object):
+    '''
+    zip 파일로 저장 (PNG/PDF는 이미 압축되어 있으므로 그대로 저장)
+    '''
+
+    def __init__(self, path, fmt):
+        compression = zipfile.ZIP_STORED if fmt in ('png', 'pdf') else zipfile.ZIP_DEFLATED
+        self.archive = zipfile.ZipFile(path, 'w', compression)
+
+    def write(self, name, data):
+        self.archive.writestr(name, data)
+
+    def close(self):
+        self.archive.close()
+
+class TarSink(object):
+    '''
+    tar 스트림으로 저장 (파일 경로 또는 '-'이면 stdout)
+    '''
+
+    def __init__(self, path):
+        compressed = path.endswith(('.tar.gz', '.tgz'))
+        mode = 'w|gz' if compressed else 'w|'
+        if path == '-':
+            self.archive = tarfile.open(fileobj=sys.stdout.buffer, mode=mode)
+        else:
+            self.archive = tarfile.open(path, mode=mode)
+        self.mtime = time.time()
+
+    def write(self, name, data):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+        self.archive.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self.archive.close()
+
+def open_sink(output, fmt):
+    '''
+    출력 경로에 맞는 저장소를 여는 함수
+    :param output: .zip, .tar, .tar.gz, .tgz 파일 경로, '-' (stdout tar 스트림) 또는 폴더 경로
+    :param fmt: 출력 형식
+    :return: 저장소 (write(name, data), close())
+    '''
+    if output.endswith('.zip'):
+        return ZipSink(output, fmt)
+    if output == '-' or output.endswith(('.tar', '.tar.gz', '.tgz')):
+        return TarSink(output)
+    return DirectorySink(output)
+
+class PipelineStats(object):
+    '''
+    파이프라인 처리량 통계
+    '''
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        self.count = 0
+        self.skipped = 0
+        # 이름이 겹쳐서 바꾼 수
+        self.renamed = 0
+        self.bytes = 0
+        # 쓰기 단계에서 발생한 오류
+        self.error = None
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.start
+
+    def summary(self):
+        '''
+        :return: 처리 결과 요약 string
+        '''
+        elapsed = self.elapsed or 1e-9
+        return (f'{self.count} codes ({self.skipped} skipped, {self.renamed} renamed), {self.bytes} bytes in {self.elapsed:.2f} s: '
+                f'{self.count / elapsed:.1f} codes/s, {self.bytes / elapsed / 1024:.1f} KiB/s')
+
+def write_worker(sink, items, stats):
+    '''
+    큐에서 (이름, 이미지 bytes)를 꺼내서 저장하는 스레드 함수 (None을 받으면 종료)
+    저장 중 오류가 나면 기록해 두고, 생성 단계가 멈추지 않도록 남은 항목은 버린다
+    '''
+    while True:
+        item = items.get()
+        if item is None:
+            break
+        if stats.error is not None:
+            continue
+        name, data = item
+        try:
+            sink.write(name, data)
+        except Exception as e:
+            stats.error = e
+            continue
+        stats.count += 1
+        stats.bytes += len(data)
+
+def get_unique_name(name, used_names, stats):
+    '''
+    이미 쓴 이름이면 뒤에 _2, _3 ... 을 붙여서 겹치지 않는 이름을 구하는 함수
+    (폴더는 덮어쓰고 zip은 같은 이름 항목이 중복되므로 저장 전에 바꿈)
+    :param name: 이름
+    :param used_names: 지금까지 쓴 이름 set (새 이름이 추가됨)
+    :param stats: PipelineStats (바꾼 수 기록)
+    :return: 겹치지 않는 이름
+    '''
+    if name in used_names:
+        stats.renamed += 1
+        suffix = 2
+        while f'{name}_{suffix}' in used_names:
+            suffix += 1
+        name = f'{name}_{suffix}'
+    used_names.add(name)
+    return name
+
+def run_pipeline(
+    source,
+    output,
+    input_format=None,
+    field=None,
+    name_field=None,
+    header=True,
+    ecc_level=constants.ERROR_LEVEL_M,
+    fmt='png',
+    box_size=4,
+    border=4,
+    version=None,
+    workers=None,
+    chunksize=64,
+    queue_size=256,
+    report=sys.stderr,
+    progress=None
+):
+    '''
+    입력 데이터를 읽어서 qr코드 이미지를 만들고 저장하는 함수
+    :param source: 입력 파일 경로 또는 '-' (stdin)
+    :param output: 출력 폴더, zip/tar 파일 경로 또는 '-' (stdout tar 스트림)
+    :param input_format: csv 또는 jsonl (None이면 확장자로 판단)
+    :param field: 데이터 열
+    :param name_field: 파일 이름으로 쓸 열 (같은 이름이 다시 나오면 _2, _3 ... 을 붙임)
+    :param header: CSV 첫 줄이 헤더인지 여부
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param fmt: 출력 형식 (png, svg, pdf, eps)
+    :param box_size: 모듈 하나의 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :param version: 고정할 qr코드 버전 (None이면 데이터가 들어가는 최소 버전)
+    :param workers: 생성 프로세스 수 (None이면 CPU 개수)
+    :param chunksize: 워커에 한 번에 넘기는 데이터 개수
+    :param queue_size: 생성과 쓰기 사이 큐 크기 (가득 차면 생성이 기다림)
+    :param report: 처리량 요약을 출력할 파일 객체 (None이면 출력 안 함)
+    :param progress: 이미지 하나를 생성할 때마다 PipelineStats로 호출할 함수
+    :return: PipelineStats
+    '''
+    # 워커를 시작하기 전에 출력 옵션 확인
+    util.check_render_options(box_size, border)
+    stats = PipelineStats()
+    # 생성 단계로 넘긴 데이터의 이름 (생성 결과와 순서가 같음)
+    names = collections.deque()
+    # 지금까지 쓴 이름 (줄 번호 이름은 겹치지 않으므로 name_field를 쓸 때만 보관)
+    used_names = set() if name_field is not None else None
+
+    def payloads():
+        for name, data in read_payloads(source, input_format, field, name_field, header):
+            # 데이터가 없거나 문자열이 아닌 줄, 어떤 버전에도 들어가지 않는 데이터는 건너뛰기
+            if data is None or not util.fits(data, ecc_level, version or 40):
+                stats.skipped += 1
+                continue
+            if used_names is not None:
+                name = get_unique_name(name, used_names, stats)
+            names.append(name)
+            yield data
+
+    sink = open_sink(output, fmt)
+    items = queue.Queue(queue_size)
+    writer = threading.Thread(target=write_worker, args=(sink, items, stats), daemon=True)
+    writer.start()
+    try:
+        images = batch.render_many(payloads(), ecc_level, fmt, box_size, border, version, workers, chunksize)
+        for image in images:
+            items.put((f'{names.popleft()}.{fmt}', image))
+            if stats.error is not None:
+                break
+            if progress is not None:
+                progress(stats)
+    finally:
+        items.put(None)
+        writer.join()
+        sink.close()
+        stats.finish()
+    if stats.error is not None:
+        raise stats.error
+
+    if report is not None:
+        print(stats.summary(), file=report)
+    return stats
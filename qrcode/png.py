@@ -0,0 +1,82 @@
+import struct
+import zlib
+
+'''
+Pillow 없이 qr코드를 1비트 흑백 PNG로 저장하는 모듈
+픽셀 행(scanline)을 하나씩 만들어 zlib으로 바로 압축하므로
+출력 크기와 상관없이 scanline 하나 만큼의 메모리만 사용한다
+'''
+
+# PNG 파일 시그니처
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# IDAT 청크 하나에 모아서 쓸 압축 데이터 크기
+IDAT_CHUNK_SIZE = 1 << 16
+
+def write_chunk(stream, chunk_type, data):
+    '''
+    PNG 청크를 쓰는 함수
+    :param stream: 출력 파일 객체
+    :param chunk_type: 청크 종류 (4바이트)
+    :param data: 청크 데이터
+    '''
+    stream.write(struct.pack('>I', len(data)))
+    stream.write(chunk_type)
+    stream.write(data)
+    stream.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(chunk_type))))
+
+def iter_scanlines(modules, box_size, border):
+    '''
+    모듈 행마다 PNG scanline(필터 바이트 + 1비트 픽셀)을 만드는 제너레이터
+    :param modules: qr코드 2darray
+    :param box_size: 모듈 하나의 픽셀 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :return: (scanline, 반복 횟수)
+    '''
+    module_count = len(modules)
+    width = (module_count + border * 2) * box_size
+    # 행 끝의 남는 비트는 0으로 채움
+    padding = '0' * (-width % 8)
+    # 흰색 1, 검정색 0
+    white = '1' * box_size
+    black = '0' * box_size
+    quiet = white * border
+
+    # 위아래 여백 scanline
+    blank = b'\x00' + int(white * (module_count + border * 2) + padding, 2).to_bytes((width + 7) // 8, 'big')
+    yield blank, border * box_size
+    for row in modules:
+        bits = quiet + ''.join(black if m else white for m in row) + quiet + padding
+        yield b'\x00' + int(bits, 2).to_bytes((width + 7) // 8, 'big'), box_size
+    yield blank, border * box_size
+
+def write_png(modules, stream, box_size=4, border=4):
+    '''
+    qr코드를 1비트 흑백 PNG로 출력하는 함수
+    :param modules: qr코드 2darray
+    :param stream: 출력 파일 객체 (write 지원)
+    :param box_size: 모듈 하나의 픽셀 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    '''
+    size = (len(modules) + border * 2) * box_size
+
+    stream.write(PNG_SIGNATURE)
+    # 가로, 세로, 비트 깊이 1, 흑백(0), 압축, 필터, 인터레이스 없음
+    write_chunk(stream, b'IHDR', struct.pack('>IIBBBBB', size, size, 1, 0, 0, 0, 0))
+
+    compressor = zlib.compressobj(9)
+    pending = []
+    pending_size = 0
+    for scanline, repeat in iter_scanlines(modules, box_size, border):
+        for _ in range(repeat):
+            data = compressor.compress(scanline)
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+        # 압축 데이터가 충분히 모이면 IDAT 청크로 내보내기
+        if pending_size >= IDAT_CHUNK_SIZE:
+            write_chunk(stream, b'IDAT', b''.join(pending))
+            pending = []
+            pending_size = 0
+    pending.append(compressor.flush())
+    write_chunk(stream, b'IDAT', b''.join(pending))
+    write_chunk(stream, b'IEND', b'')
@@ -1,11 +1,20 @@
-from PIL import Image
-import copy
-import re
+import bisect
+import io
+import time
 
-import error_correction.reed_solomon as reed_solomon
-import error_correction.bch as bch
+from qrcode.bitbuffer import BitBuffer
+import qrcode.blocks as blocks
 import qrcode.constants as constants
+import qrcode.layout as layout
+import qrcode.png as png
+import qrcode.timing as timing
 import qrcode.util as util
+import qrcode.vector as vector
+
+# '0'/'1' 문자를 0/1 값으로 바꾸는 변환 테이블
+BIT_TABLE = bytes.maketrans(b'01', b'\x00\x01')
+# 0/1 모듈 값을 흑백 픽셀 값으로 바꾸는 변환 테이블 (1이 검정색)
+PIXEL_TABLE = bytes.maketrans(b'\x00\x01', b'\xff\x00')
 
 '''
 QRCode 클래스
@@ -16,387 +25,321 @@ class QRCode(object):
     def __init__(
         self,
         data: str,
-        ecc_level=constants.ERROR_LEVEL_M
+        ecc_level=constants.ERROR_LEVEL_M,
+        version=None,
+        mask_bit=None,
+        timings=None
     ):
+        '''
+        :param data: 입력 데이터
+        :param ecc_level: qr코드 오류 정정 레벨
+        :param version: 고정할 qr코드 버전 (None이면 데이터가 들어가는 최소 버전)
+        :param mask_bit: 고정할 마스크 비트 (None이면 패널티가 가장 작은 마스크)
+        :param timings: 단계별 시간을 모을 timing.StageTimings (None이면 timing.collect() 의 collector)
+        '''
         self.data = data
         self.ecc_level = ecc_level
+        self.fixed_version = version
+        self.fixed_mask_bit = mask_bit
+        self.timings = timings if timings is not None else timing.active
 
         self.__make__()
 
     def __add_error_bits__(self):
         '''
         Reed-Solomon 알고리즘으로 에러 정정 비트 추가하는 함수
+        (버전, ecc level)별로 캐시된 블록 구성 계획으로 블록마다 에러 정정 코드워드를 만들고 한 번에 섞는다
         '''
-
-        # 정의된 블록 정보에 따라 만들어야 할 오류 정정 코드워드 개수 산출
-        error_blocks = []
-        error_block_size = constants.ERROR_BLOCK_TABLE[self.ecc_level][self.version - 1]
-        for i in range(0, len(error_block_size), 4):
-            block_count, total_count, data_count, error_count = error_block_size[i:i + 4]
-            for idx in range(block_count):
-                error_blocks.append((total_count, data_count, error_count))
-
-        data_idx = 0 # 데이터 idx
-        data_code = [] # 데이터 코드워드
-        error_code = [] # 에러 정정 코드워드
-
-        max_data_length = 0 # 최대 데이터 코드워드 길이
-        max_error_data_length = 0 # 최대 에러 정정 코드워드 길이
-        # additional_blocks = 0
-
-        # 에러 정정 코드워드 개수 만큼 반복
-        for error_block in error_blocks:
-            # 사전 정의된 개수 정보 가져오기
-            total_count, data_count, error_count = error_block
-            # 에러 코드워드 개수 = 전체 코드워드 - 데이터 코드워드
-            error_count = total_count - data_count
-
-            # additional_blocks += total_count - (data_count + 2 * error_count)
-
-            # 최대 데이터 코드워드 길이 업데이트
-            max_data_length = max(max_data_length, data_count)
-            # 최대 에러 정정 코드워드 길이 업데이트
-            max_error_data_length = max(max_error_data_length, error_count)
-
-            # 데이터 코드워드 개수에 맞게 인코딩된 비트 가져오기
-            target_data = []
-            for idx in range(data_count):
-                data = self.encoded_data[data_idx:data_idx + 8]
-                target_data.append(data)
-                data_idx += 8
-            # 데이터 비트에 reed-solomon 에러 정정 비트 추가
-            rs_data = reed_solomon.rs_encode_msg([int(d, 2) for d in target_data], error_count)
-            # 에러 정정 비트만 추출
-            rs_data = rs_data[len(target_data):]
-
-            # 데이터 코드워드 추가
-            data_code.append(target_data)
-            # 오류 정정 코드워드 추가
-            error_code.append([format(d, '08b') for d in rs_data])
-
-        # 블록 리스트
-        self.data_block = []
-        # 데이터 코드워드를 순회하며 앞 비트부터 순서대로 추가
-        for i in range(max_data_length):
-            for d in data_code:
-                if i < len(d):
-                    self.data_block.append(d[i])
-        # 오류 정정 코드워드를 순회하며 앞 비트부터 순서대로 추가
-        for i in range(max_error_data_length):
-            for d in error_code:
-                if i < len(d):
-                    self.data_block.append(d[i])
-        # for _ in range(additional_blocks):
-        #     self.data_block.append('00000000')
+        self.data_block = self.plan.add_error_correction(self.encoded_data.to_bytes())
 
     def __encode_data__(self):
         '''
         데이터를 비트로 인코딩하는 함수
+        한 모드로 인코딩하는 것보다 여러 모드 세그먼트로 나누는 쪽이 더 작은 버전에 들어가면 나눠서 인코딩한다
         '''
 
-        # QR코드 모드 결정
-        self.mode = util.determine_mode(self.data)
-        # 데이터 길이 저장
-        self.data_length = len(self.data)
-
-        # 모드가 바이트일때
-        if self.mode == 'Byte':
-            # 데이터 utf-8 인코딩
-            self.data = self.data.encode('utf-8')
-            # 인코딩된 데이터 길이
-            self.data_length = len(self.data)
+        # 데이터를 utf-8로 인코딩하면서 문자 종류를 한 번에 구하고 QR코드 모드 결정
+        encoded, classes = util.classify(self.data)
+        self.mode = util.get_mode(classes)
+        # 데이터 길이 저장 (Byte 모드는 utf-8 바이트 수, 그 밖의 모드는 ASCII라서 같음)
+        self.data_length = len(encoded)
+
+        # 여러 모드 세그먼트로 나눠서 더 작은 버전에 들어가면 나눠서 인코딩
+        mixed = self.__split_segments__(encoded, classes)
+        if mixed is None:
+            # qr코드 버전 결정
+            self.version = util.get_version(self.data_length, self.mode, self.ecc_level)
+            # 모드가 바이트일때 데이터 utf-8 인코딩
+            if self.mode == 'Byte':
+                self.data = encoded
+            segments = [(self.mode, encoded)]
+        else:
+            self.version, segments = mixed
+            self.mode = constants.MODE_MIXED
+        self.segments = segments
+
+        # 고정할 버전이 있다면 데이터가 들어가는지 확인 후 사용
+        if self.fixed_version is not None:
+            if not self.version <= self.fixed_version <= 40:
+                raise ValueError(f'데이터가 {self.fixed_version} 버전에 맞지 않습니다. (최소 {self.version} 버전)')
+            self.version = self.fixed_version
+
+        # 세그먼트마다 모드 정보, 데이터 개수, 데이터 비트를 인코드 데이터에 추가
+        self.encoded_data = BitBuffer()
+        for mode, data in segments:
+            self.__put_segment__(mode, data)
+
+        # 버전, ecc level의 블록 구성 계획 (에러 정정, 배치 단계에서 같이 사용)
+        self.plan = blocks.get_block_plan(self.version, self.ecc_level)
+        # 인코드 데이터에 생성 후 남은 공간에 종단자, 패딩 비트 추가
+        self.encoded_data = util.add_terminator_and_pad(self.encoded_data, self.plan.data_bits)
 
+    def __split_segments__(self, encoded, classes):
+        '''
+        한 모드로 인코딩할 때보다 작은 버전(버전이 고정되어 있으면 그 버전)에 들어가도록
+        데이터를 여러 모드 세그먼트로 나누는 함수
+        :param encoded: utf-8로 인코딩한 데이터
+        :param classes: util.classify로 구한 문자 종류 bytes
+        :return: (버전, (모드, 데이터 bytes) 리스트), 나눌 필요가 없으면 None
+        '''
+        if self.fixed_version is None:
+            # 한 모드로 들어가는 버전보다 작은 버전에서만 찾기
+            max_version = bisect.bisect_left(util.MAX_CHARACTERS[(self.mode, self.ecc_level)], self.data_length)
+            version, segments = util.get_segments_version(encoded, classes, self.ecc_level, max_version)
+        else:
+            version = self.fixed_version
+            if not 1 <= version <= 40 or self.data_length <= util.capacity(self.mode, self.ecc_level, version):
+                return None
+            min_bit_length = util.get_min_bit_length(classes, self.mode)
+            capacity = constants.QRCODE_CAPACITY[self.ecc_level][version - 1]
+            if min_bit_length is None or min_bit_length > capacity:
+                return None
+            segments = util.make_segments(encoded, classes, version)
+            if util.get_segments_bit_length(segments, version) > capacity:
+                return None
+        # 세그먼트 하나면 한 모드 인코딩과 같음
+        if version is None or len(segments) == 1:
+            return None
+        return version, segments
+
+    def __put_segment__(self, mode, data):
+        '''
+        세그먼트 하나를 인코드 데이터에 추가하는 함수
+        :param mode: qr코드 모드
+        :param data: 세그먼트 데이터 utf-8 bytes
+        '''
         # 인코드 데이터에 모드 정보 비트로 추가
-        self.encoded_data = constants.MODE_BITS[self.mode]
-        # qr코드 버전 결정
-        self.version = util.get_version(self.data_length, self.mode, self.ecc_level)
+        self.encoded_data.put(int(constants.MODE_BITS[mode], 2), 4)
         # 데이터 개수 표현 비트 수 가져와서 인코드 데이터에 적용
-        char_count_indicator_length = util.get_char_count_indicator_length(self.version, self.mode)
-        self.encoded_data += format(self.data_length, f'0{char_count_indicator_length}b')
-
-        # 각 모드에 맞게 데이터 인코딩 후 인코드 데이터에 추가
-        if self.mode == 'Numeric':
-            for i in range(0, self.data_length, 3):
-                group = self.data[i:i + 3]
-                self.encoded_data += format(int(group), f'0{len(group) * 3 + 1}b')
-        elif self.mode == 'Alphanumeric':
-            alphanumeric_chars = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:'
-            for i in range(0, self.data_length, 2):
-                if i + 1 < self.data_length:
-                    pair = self.data[i:i + 2]
-                    value = alphanumeric_chars.index(pair[0]) * 45 + alphanumeric_chars.index(pair[1])
-                    self.encoded_data += format(value, '011b')
-                else:
-                    value = alphanumeric_chars.index(self.data[i])
-                    self.encoded_data += format(value, '06b')
-        elif self.mode == 'Byte':  # utf-8
-            # encoded_data = '011100011010' + encoded_data
-            # encoded_data += '0000'
-            for char in self.data:
-                self.encoded_data += format(char, '08b')
+        char_count_indicator_length = util.get_char_count_indicator_length(self.version, mode)
+        self.encoded_data.put(len(data), char_count_indicator_length)
 
-        # 인코드 데이터에 생성 후 남은 공간에 종단자, 패딩 비트 추가
-        self.encoded_data = util.add_terminator_and_pad(
-            self.encoded_data, constants.QRCODE_CAPACITY[self.ecc_level][self.version - 1])
-
-    def __add_finder_pattern__(self, modules, start_x, start_y):
-        '''
-        파인더 패턴을 추가하는 함수
-        :param modules: qr코드 2darray
-        :param start_x: 가로 시작 위치
-        :param start_y: 세로 시작 위치
-        '''
-        # 파인더 패턴 바깥 분리자 추가
-        for i in range(start_y - 1, start_y + 8):
-            for j in range(start_x - 1, start_x + 8):
-                if 0 <= i < self.module_count and 0 <= j < self.module_count:
-                    if i == start_y - 1 or i == start_y + 7:
-                        modules[i][j] = 0
-                    elif j == start_x - 1 or j == start_x + 7:
-                        modules[i][j] = 0
-        # 7x7 검정색 패턴 추가
-        for i in range(start_y, start_y + 7):
-            for j in range(start_x, start_x + 7):
-                if i == start_y or i == start_y + 6:
-                    modules[i][j] = 1
-                elif j == start_x or j == start_x + 6:
-                    modules[i][j] = 1
-        # 6x6 흰색 패턴 추가
-        for i in range(start_y + 1, start_y + 6):
-            for j in range(start_x + 1, start_x + 6):
-                if i == start_y + 1 or i == start_y + 5:
-                    modules[i][j] = 0
-                elif j == start_x + 1 or j == start_x + 5:
-                    modules[i][j] = 0
-        # 5x5 검정색 패턴 추가
-        for i in range(start_y + 2, start_y + 5):
-            for j in range(start_x + 2, start_x + 5):
-                modules[i][j] = 1
-                
-    def __add_align_pattern__(self, modules):
-        '''
-        정렬 패턴을 추가하는 함수
-        :param modules: qr코드 2darray
-        '''
-        # 사전 정의된 버전별 정렬 패턴 위치 가져오기
-        pos = constants.ALIGN_PATTERN_POSITION[self.version - 1]
-        # 정렬 패턴 추가
-        for i in range(len(pos)):
-            row = pos[i]
-            for j in range(len(pos)):
-                col = pos[j]
-                if modules[row][col] != 2:
-                    continue
-                for r in range(-2, 3):
-                    for c in range(-2, 3):
-                        if r == -2 or r == 2 or c == -2 or c == 2 or (r == 0 and c == 0):
-                            modules[row + r][col + c] = 1
-                        else:
-                            modules[row + r][col + c] = 0
-
-    def __add_timing_pattern__(self, modules):
-        '''
-        타이밍 패턴을 추가하는 함수
-        :param modules: qr코드 2darray
-        '''
-        # 세로 타이밍 패턴 추가
-        for i in range(8, self.module_count - 8):
-            if modules[i][6] != 2: continue
-            modules[i][6] = int(i % 2 == 0)
-        # 가로 타이밍 패턴 추가
-        for i in range(8, self.module_count - 8):
-            if modules[6][i] != 2: continue
-            modules[6][i] = int(i % 2 == 0)
-
-    def __add_version_information__(self, modules):
-        '''
-        버전 정보를 추가하는 함수
-        :param modules: qr코드 2darray
-        '''
-
-        # 버전 수 6비트의 이진수로 변환
-        version_bits = format(self.version, '06b')
-        # bch 알고리즘으로 에러 정정 비트 추가
-        version_bits += bch.bch_encode(self.version, 18, 6, [1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 0, 1])
-        # 좌측 하단 파인더 패턴 위와 우측 상단 파인더 패턴 왼쪽에 버전 정보 추가
-        bits_idx = 17
-        for i in range(0, 6):
-            for j in range(self.module_count - 11, self.module_count - 8):
-                modules[j][i] = int(version_bits[bits_idx])
-                modules[i][j] = int(version_bits[bits_idx])
-                bits_idx -= 1
+        # 모드별 인코더로 세그먼트 전체를 한 번에 묶어서 추가
+        if mode == 'Byte':
+            self.encoded_data.put_bytes(data)
+        else:
+            self.encoded_data.put(*util.SEGMENT_ENCODERS[mode](data))
 
     def __add_format_information__(self, modules, mask_bit):
         '''
         포맷 정보를 추가하는 함수
-        :param modules: qr코드 2darray
+        :param modules: 행 순서로 펼친 qr코드를 정수로 표현한 값
+        :param mask_bit: 마스크 비트
+        :return: 포맷 정보 추가가 완료된 값
+        '''
+        # 미리 계산된 포맷 정보 비트 평면을 한 번에 적용
+        return modules | layout.get_format_plane(self.version, self.ecc_level, mask_bit)
+
+    def __place_data__(self):
+        '''
+        버전별로 캐시된 배치 순서에 따라 데이터 비트를 배치하는 함수
+        마스크와 무관하므로 심볼마다 한 번만 수행한다
+        :return: 데이터가 배치된 qr코드 (행 순서로 펼친 bytearray)
+        '''
+        # 블록 코드워드를 비트 단위로 펼치고 남는 칸은 0 비트로 채우기
+        bits = format(int.from_bytes(self.data_block, 'big'), f'0{len(self.data_block) * 8}b')
+        bits = bits.encode().translate(BIT_TABLE) + bytes(self.plan.remainder_bits)
+        # 비트 뒤에 템플릿을 이어 붙이고 캐시된 gather로 한 번에 배치
+        return bytearray(self.plan.placement(bits + layout.get_template(self.version)))
+
+    def __add_data_with_mask__(self, data_modules, mask_bit):
+        '''
+        배치된 데이터에 마스크를 적용하는 함수
+        :param data_modules: 데이터가 배치된 qr코드를 정수로 표현한 값
         :param mask_bit: 마스크 비트
-        :return: 포맷 정보 추가가 완료된 qr코드 2darray
-        '''
-        # ecc level 비트 + 마스크 비트 = 포맷 비트
-        format_bit = constants.ERROR_LEVEL_BITS[self.ecc_level] + mask_bit
-        # 포맷 비트에 에러 정정 비트 추가
-        format_bit += bch.bch_encode(int(format_bit, 2), 15, 5, [1, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1])
-        format_bit = [int(b) for b in format_bit]
-        # 포맷 비트에 XOR 연산으로 마스크 적용
-        mask = [1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0]
-        for i in range(15):
-            format_bit[i] = format_bit[i] ^ mask[i]
-
-        # 지정된 위치에 포맷 정보 비트 추가
-        bit_idx = 14
-        # 좌측 상단 파인더 패턴 왼쪽
-        for i in range(0, 9):
-            if i == 6: continue
-            modules[i][8] = format_bit[bit_idx]
-            bit_idx -= 1
-        # 좌측 상단 파인더 패턴 아래
-        for i in range(7, -1, -1):
-            if i == 6: continue
-            modules[8][i] = format_bit[bit_idx]
-            bit_idx -= 1
-
-        bit_idx = 14
-        # 우측 상단 파인더 패턴 아래
-        for i in range(self.module_count - 1, self.module_count - 9, -1):
-            if i == self.module_count - 8:
-                modules[8][i] = 1
-                continue
-            modules[8][i] = format_bit[bit_idx]
-            bit_idx -= 1
-        # 좌측 하단 파인더 패턴 왼쪽
-        for i in range(self.module_count - 8, self.module_count):
-            modules[i][8] = format_bit[bit_idx]
-            bit_idx -= 1
-        return modules
-
-    def __add_data_with_mask__(self, modules, mask_func):
-        '''
-        데이터를 마스킹 해서 추가하는 함수
-        :param modules: qr코드 2darray
-        :param mask_func: 마스크 적용 위치 판별 함수
-        :return: 데이터 및 마스킹이 완료된 qr코드 2darray
-        '''
-
-        # 세로 이동 방향
-        direction_y = -1
-        # qr코드 가로 위치
-        x = self.module_count - 1
-        # qr코드 세로 위치
-        y = self.module_count - 1
-
-        # 비트 idx 0~7
-        bit_idx = 0
-        # 바이트(블록) idx
-        byte_idx = 0
-
-        # 모든 칸을 순회
-        while True:
-            # 아무 데이터도 없는 칸이라면
-            if modules[y][x] == 2:
-                # 데이터 비트 0으로 초기화
-                target_bit = 0
-                # 아직 블록이 남았다면
-                if byte_idx < len(self.data_block):
-                    # 블록의 bit_idx번째 비트 가져오기
-                    target_bit = int(self.data_block[byte_idx][bit_idx])
-
-                # 마스크를 적용시킬 칸 이라면 비트 반전
-                if mask_func(y, x):
-                    target_bit ^= 1
-                # qr코드에 비트 적용
-                modules[y][x] = target_bit
-                # 비트 idx + 1
-                bit_idx += 1
-                # 8비트 모두 사용했다면 다음 블록으로 넘어가기
-                if bit_idx == 8:
-                    bit_idx = 0
-                    byte_idx += 1
-
-            # 데이터가 들어갈 수 있는 마지막 칸에 도달하면 break
-            if x == 0 and y == self.module_count - 9:
-                break
-
-            # 규칙에 따라 칸을 순회하도록 설정
-            if (x % 2 == 0) ^ (x <= 6):
-                x -= 1
-            else:
-                x += 1
-                y += direction_y
-                if y < 0:
-                    direction_y = 1
-                    y = 0
-                    x -= 2
-                elif y >= self.module_count:
-                    direction_y = -1
-                    y = self.module_count - 1
-                    x -= 2
-            if x == 6:
-                x -= 1
-
-        return modules
+        :return: 마스킹이 완료된 값
+        '''
+        # 버전별로 캐시된 마스크 비트 평면과 XOR 해서 한 번에 반전
+        return data_modules ^ layout.get_mask_planes(self.version)[mask_bit]
+
+    def __to_2darray__(self, modules):
+        '''
+        정수로 표현한 qr코드를 2darray로 바꾸는 함수
+        :param modules: 행 순서로 펼친 qr코드를 정수로 표현한 값
+        :return: qr코드 2darray
+        '''
+        flat = modules.to_bytes(self.module_count * self.module_count, 'big')
+        return [list(flat[i:i + self.module_count]) for i in range(0, len(flat), self.module_count)]
 
     def __make__(self):
+        # 측정할 collector가 없으면 record는 None이고 단계마다 None 검사만 함
+        record = None if self.timings is None else timing.SymbolTiming()
+        self.timing = record
+
         self.__encode_data__()
+        if record is not None:
+            record.lap('encode')
         self.__add_error_bits__()
+        if record is not None:
+            record.lap('error_correction')
 
         # 버전 정보로 qr코드에 들어가는 비트 개수 산출
-        self.module_count = self.version * 4 + 17
-        # qr코드를 표현할 2darray
-        modules = [[2] * self.module_count for _ in range(self.module_count)]
-        # 좌측 상단 파이더 패턴 추가
-        self.__add_finder_pattern__(modules, 0, 0)
-        # 우측 상단 파인더 패턴 추가
-        self.__add_finder_pattern__(modules, self.module_count - 7, 0)
-        # 좌측 하단 파인더 패턴 추가
-        self.__add_finder_pattern__(modules, 0, self.module_count - 7)
-        # 정렬 패턴 추가
-        self.__add_align_pattern__(modules)
-        # 타이밍 패턴 추가
-        self.__add_timing_pattern__(modules)
-
-        # qr코드의 버전이 7 이상이면 버전 정보 추가
-        if self.version >= 7:
-            self.__add_version_information__(modules)
-
-        # 가장 낮은 패널티 점수
-        min_penalty = 1e10
-        # 가장 낮은 패널티의 마스크 비트
-        min_mask = 0
-        # 가장 낮은 패널티의 qr코드
-        min_module = []
-        # 모든 마스크 비트 생성
-        for mask_bit in constants.MASK_BITS:
-            # 마스크에 따라 마스크 함수 가져오기
-            mask_f = constants.MASK_FUNCTION[mask_bit]
-            # 현재 qr코드 deepcopy
-            option = copy.deepcopy(modules)
+        self.module_count = layout.get_module_count(self.version)
+        # 버전별로 캐시된 템플릿에 데이터 비트 배치 후 정수로 표현
+        data_modules = int.from_bytes(self.__place_data__(), 'big')
+        if record is not None:
+            record.lap('placement')
+
+        # 모든 마스크 비트로 후보 생성 (마스크가 고정되어 있으면 하나만)
+        mask_bits = constants.MASK_BITS if self.fixed_mask_bit is None else [self.fixed_mask_bit]
+        options = []
+        for mask_bit in mask_bits:
+            # 배치된 데이터에 마스크 적용
+            option = self.__add_data_with_mask__(data_modules, mask_bit)
             # ecc level, 마스크 정보를 포함한 포맷 정보 추가
             option = self.__add_format_information__(option, mask_bit)
-            # 마스크를 적용해서 데이터 영역 추가
-            option = self.__add_data_with_mask__(option, mask_f)
-            # 마스크 적용 패널티 계산
-            penalty = util.evaluate_mask(option, self.module_count)
-            # 패널티 점수가 가장 작다면 해당 버전의 qr코드 저장
-            if penalty < min_penalty:
-                min_penalty = penalty
-                min_module = option
-                min_mask = mask_bit
+            options.append(self.__to_2darray__(option))
+            if record is not None:
+                record.lap(f'mask_{mask_bit}')
+        # 모든 후보의 마스크 적용 패널티를 한 번에 계산
+        penalties = util.evaluate_masks(options, self.module_count)
+        if record is not None:
+            record.lap('evaluate_masks')
+        # 패널티 점수가 가장 작은 후보 선택 (같으면 앞의 마스크)
+        min_idx = penalties.index(min(penalties))
+        self.mask_bit = mask_bits[min_idx]
+        self.penalty = penalties[min_idx]
         # 최종 qr코드 데이터 확정
-        self.qr_data = min_module
-        
-    def save_image(self, dir):
-        width, height = 4 * self.module_count, 4 * self.module_count
-        image = Image.new('1', (32 + width, 32 + height))
-        pixels = image.load()
-
-        for i in range(32 + width):
-            for j in range(32 + height):
-                pixels[i, j] = 1
-
-        for i in range(self.module_count):
-            for j in range(self.module_count):
-                for p_i in range(i * 4 + 16, i * 4 + 20):
-                    for p_j in range(j * 4 + 16, j * 4 + 20):
-                        pixels[p_j, p_i] = 1 - self.qr_data[i][j]
-        image.save(dir)
+        self.qr_data = options[min_idx]
+
+        if record is not None:
+            record.finish(self)
+            self.timings.add(record)
+
+    def __getstate__(self):
+        # 다른 프로세스로 보낼 때 collector와 캐시된 블록 구성 계획은 같이 보내지 않음
+        state = self.__dict__.copy()
+        state['timings'] = None
+        state.pop('plan', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if 'version' in state:
+            self.plan = blocks.get_block_plan(self.version, self.ecc_level)
+
+    def __add_render_time__(self, fmt, start):
+        '''
+        출력에 걸린 시간을 기록하는 함수
+        :param fmt: 출력 형식 (image, png, svg, pdf, eps)
+        :param start: 출력 시작 시각 (time.perf_counter)
+        '''
+        self.timings.add_render(self.timing, fmt, time.perf_counter() - start)
+
+    def save_image(self, dir, box_size=4, border=4):
+        '''
+        qr코드를 이미지 파일로 저장하는 함수
+        :param dir: 저장할 파일 경로
+        :param box_size: 모듈 하나의 픽셀 크기
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        '''
+        # Pillow는 이미지를 만들 때만 불러옴
+        from PIL import Image
+
+        util.check_render_options(box_size, border)
+        render_start = time.perf_counter() if self.timings is not None else None
+
+        size = self.module_count + border * 2
+        # 모듈 하나당 한 픽셀인 흑백 버퍼 (흰색 255, 검정 0)
+        pixels = bytearray(b'\xff' * (size * size))
+        for i, row in enumerate(self.qr_data):
+            start = (i + border) * size + border
+            pixels[start:start + self.module_count] = bytes(row).translate(PIXEL_TABLE)
+
+        # 버퍼로 이미지를 만들고 box_size 배로 한 번에 확대
+        image = Image.frombytes('L', (size, size), bytes(pixels))
+        if box_size != 1:
+            image = image.resize((size * box_size, size * box_size), Image.Resampling.NEAREST)
+        image.convert('1', dither=Image.Dither.NONE).save(dir)
+        if render_start is not None:
+            self.__add_render_time__('image', render_start)
+
+    def __save__(self, fmt, writer, dir, box_size, border):
+        '''
+        출력 함수로 qr코드를 파일 경로 또는 파일 객체에 저장하는 함수
+        :param fmt: 출력 형식 이름
+        :param writer: 출력 함수 (modules, stream, box_size, border)
+        :param dir: 저장할 파일 경로 또는 파일 객체
+        :param box_size: 모듈 하나의 크기
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        '''
+        util.check_render_options(box_size, border)
+        render_start = time.perf_counter() if self.timings is not None else None
+        if hasattr(dir, 'write'):
+            writer(self.qr_data, dir, box_size, border)
+        else:
+            with open(dir, 'wb') as file:
+                writer(self.qr_data, file, box_size, border)
+        if render_start is not None:
+            self.__add_render_time__(fmt, render_start)
+
+    def save_png(self, dir, box_size=4, border=4):
+        '''
+        Pillow 없이 qr코드를 1비트 PNG로 저장하는 함수
+        scanline 단위로 압축하므로 큰 이미지도 메모리를 적게 사용한다
+        :param dir: 저장할 파일 경로 또는 파일 객체
+        :param box_size: 모듈 하나의 픽셀 크기
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        '''
+        self.__save__('png', png.write_png, dir, box_size, border)
+
+    def save_svg(self, dir, box_size=4, border=4):
+        '''
+        qr코드를 SVG로 저장하는 함수
+        :param dir: 저장할 파일 경로 또는 파일 객체
+        :param box_size: 모듈 하나의 픽셀 크기
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        '''
+        self.__save__('svg', vector.write_svg, dir, box_size, border)
+
+    def save_pdf(self, dir, box_size=4, border=4):
+        '''
+        qr코드를 PDF로 저장하는 함수
+        :param dir: 저장할 파일 경로 또는 파일 객체
+        :param box_size: 모듈 하나의 크기 (pt)
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        '''
+        self.__save__('pdf', vector.write_pdf, dir, box_size, border)
+
+    def save_eps(self, dir, box_size=4, border=4):
+        '''
+        qr코드를 EPS로 저장하는 함수
+        :param dir: 저장할 파일 경로 또는 파일 객체
+        :param box_size: 모듈 하나의 크기 (pt)
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        '''
+        self.__save__('eps', vector.write_eps, dir, box_size, border)
+
+    def to_bytes(self, fmt='png', box_size=4, border=4):
+        '''
+        qr코드를 출력 형식의 bytes로 바꾸는 함수
+        :param fmt: 출력 형식 (png, svg, pdf, eps)
+        :param box_size: 모듈 하나의 크기
+        :param border: 바깥 여백(quiet zone) 모듈 개수
+        :return: 이미지 bytes
+        '''
+        if fmt not in constants.OUTPUT_FORMATS:
+            raise ValueError(f'지원하지 않는 출력 형식입니다: {fmt}')
+        stream = io.BytesIO()
+        getattr(self, f'save_{fmt}')(stream, box_size=box_size, border=border)
+        return stream.getvalue()
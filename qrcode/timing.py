@@ -0,0 +1,189 @@
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+'''
+qr코드 생성 단계별 시간 측정 모듈
+QRCode(..., timings=StageTimings()) 처럼 넘기거나 with collect() 안에서 만들면
+단계별 시간과 선택된 버전/마스크/패널티를 기록한다
+아무 collector도 없으면 단계마다 None 검사 한 번만 하므로 추가 비용이 거의 없다
+'''
+
+# with collect() 로 설정되는 전역 collector (None이면 측정하지 않음)
+active = None
+
+class SymbolTiming(object):
+    '''
+    qr코드 하나의 단계별 측정 결과
+    '''
+    def __init__(self):
+        self.stages = {}
+        self.version = None
+        self.ecc_level = None
+        self.mode = None
+        self.data_length = None
+        self.mask_bit = None
+        self.penalty = None
+        self.last = time.perf_counter()
+
+    def lap(self, stage):
+        '''
+        직전 lap 이후 지난 시간을 단계 시간으로 기록하는 함수
+        :param stage: 단계 이름
+        '''
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self.last
+        self.last = now
+
+    def finish(self, qrcode):
+        '''
+        생성이 끝난 qr코드의 버전, 마스크, 패널티를 기록하는 함수
+        '''
+        self.version = qrcode.version
+        self.ecc_level = qrcode.ecc_level
+        self.mode = qrcode.mode
+        self.data_length = qrcode.data_length
+        self.mask_bit = qrcode.mask_bit
+        self.penalty = qrcode.penalty
+
+    @property
+    def total(self):
+        return sum(self.stages.values())
+
+class StageTimings(object):
+    '''
+    여러 qr코드의 단계별 시간을 모으는 collector
+    여러 스레드에서 같이 사용해도 안전하고, merge로 다른 프로세스의 결과를 합칠 수 있다
+    '''
+    def __init__(self):
+        self.count = 0
+        self.totals = {}
+        self.calls = {}
+        self.maxima = {}
+        self.versions = Counter()
+        self.ecc_levels = Counter()
+        self.mask_bits = Counter()
+        self.penalty_total = 0
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # Lock은 pickle 할 수 없으므로 빼고 보냄
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def __add_stage__(self, stage, elapsed):
+        self.totals[stage] = self.totals.get(stage, 0.0) + elapsed
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+        self.maxima[stage] = max(self.maxima.get(stage, 0.0), elapsed)
+
+    def add(self, record):
+        '''
+        qr코드 하나의 측정 결과를 더하는 함수
+        :param record: SymbolTiming
+        '''
+        with self.lock:
+            self.count += 1
+            for stage, elapsed in record.stages.items():
+                self.__add_stage__(stage, elapsed)
+            self.versions[record.version] += 1
+            self.ecc_levels[record.ecc_level] += 1
+            self.mask_bits[record.mask_bit] += 1
+            self.penalty_total += record.penalty
+
+    def add_render(self, record, fmt, elapsed):
+        '''
+        생성된 qr코드를 출력하는 데 걸린 시간을 더하는 함수
+        :param record: 출력한 qr코드의 SymbolTiming (다른 프로세스에서 받은 qr코드면 None)
+        :param fmt: 출력 형식 (image, png, svg, pdf, eps)
+        :param elapsed: 초
+        '''
+        if record is not None:
+            record.stages['render'] = record.stages.get('render', 0.0) + elapsed
+        with self.lock:
+            self.__add_stage__('render', elapsed)
+
+    def merge(self, other):
+        '''
+        다른 collector(다른 프로세스 결과 등)의 측정 결과를 합치는 함수
+        :param other: StageTimings
+        '''
+        with self.lock:
+            self.count += other.count
+            for stage, elapsed in other.totals.items():
+                self.totals[stage] = self.totals.get(stage, 0.0) + elapsed
+                self.calls[stage] = self.calls.get(stage, 0) + other.calls[stage]
+                self.maxima[stage] = max(self.maxima.get(stage, 0.0), other.maxima[stage])
+            self.versions.update(other.versions)
+            self.ecc_levels.update(other.ecc_levels)
+            self.mask_bits.update(other.mask_bits)
+            self.penalty_total += other.penalty_total
+
+    def clear(self):
+        with self.lock:
+            self.count = 0
+            self.totals.clear()
+            self.calls.clear()
+            self.maxima.clear()
+            self.versions.clear()
+            self.ecc_levels.clear()
+            self.mask_bits.clear()
+            self.penalty_total = 0
+
+    def stats(self):
+        '''
+        단계별 호출 횟수, 전체/평균/최대 시간과 버전, 마스크 분포를 반환하는 함수
+        '''
+        with self.lock:
+            return {
+                'count': self.count,
+                'stages': {
+                    stage: {
+                        'calls': self.calls[stage],
+                        'total': total,
+                        'mean': total / self.calls[stage],
+                        'max': self.maxima[stage],
+                    }
+                    for stage, total in self.totals.items()
+                },
+                'versions': dict(self.versions),
+                'ecc_levels': dict(self.ecc_levels),
+                'mask_bits': dict(self.mask_bits),
+                'mean_penalty': self.penalty_total / self.count if self.count else 0.0,
+            }
+
+    def summary(self):
+        '''
+        단계별 시간을 표로 만드는 함수
+        '''
+        stats = self.stats()
+        total = sum(stage['total'] for stage in stats['stages'].values()) or 1e-9
+        lines = [f'{"stage":<20} {"calls":>8} {"total(ms)":>12} {"mean(ms)":>10} {"max(ms)":>10} {"share":>7}']
+        for name, stage in sorted(stats['stages'].items(), key=lambda item: -item[1]['total']):
+            lines.append(f'{name:<20} {stage["calls"]:>8} {stage["total"] * 1000:>12.1f} '
+                         f'{stage["mean"] * 1000:>10.3f} {stage["max"] * 1000:>10.3f} '
+                         f'{stage["total"] / total:>7.1%}')
+        lines.append(f'{stats["count"]} codes, versions {sorted(stats["versions"].items())}, '
+                     f'masks {sorted(stats["mask_bits"].items())}, '
+                     f'mean penalty {stats["mean_penalty"]:.1f}')
+        return '\n'.join(lines)
+
+@contextmanager
+def collect(timings=None):
+    '''
+    with 블록 안에서 만드는 모든 qr코드의 단계별 시간을 모으는 함수
+    :param timings: 결과를 모을 StageTimings (None이면 새로 만듦)
+    :return: StageTimings
+    '''
+    global active
+    previous = active
+    active = timings if timings is not None else StageTimings()
+    try:
+        yield active
+    finally:
+        active = previous
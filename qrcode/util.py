@@ -1,18 +1,56 @@
+import bisect
+import importlib.util
 import re
+from functools import lru_cache
 import qrcode.constants as constants
 
+# 남는 공간을 채우는 두 패딩 바이트 (11101100, 00010001)
+PADDING_BYTES = b'\xec\x11'
+
+# numpy가 설치되어 있으면 마스크 패널티를 배열 연산으로 계산
+# 시작 시간을 줄이기 위해 실제 import는 처음 계산할 때 한다
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+# utf-8 바이트를 문자 종류로 바꾸는 변환 테이블 (ASCII 숫자 0, 그 밖의 Alphanumeric 문자 1, 나머지 2)
+# 0xB2('²') 같은 utf-8 연속 바이트가 숫자가 되지 않도록 ASCII 0-9만 숫자로 본다
+CHAR_CLASS_TABLE = bytes(
+    0 if 48 <= i <= 57 else 1 if chr(i) in constants.ALPHANUMERIC_CHARS else 2
+    for i in range(256)
+)
+# 문자 종류별 모드
+CLASS_NUMERIC = b'\x00'
+CLASS_ALPHANUMERIC = b'\x01'
+CLASS_BYTE = b'\x02'
+
+def classify(data):
+    '''
+    데이터를 utf-8로 인코딩하고 바이트마다 문자 종류를 구하는 함수 (한 번의 translate)
+    utf-8의 ASCII가 아닌 바이트는 모두 Byte 종류가 된다
+    :param data: 입력 데이터
+    :return: (utf-8 bytes, 문자 종류 bytes)
+    '''
+    encoded = data.encode('utf-8')
+    return encoded, encoded.translate(CHAR_CLASS_TABLE)
+
+def get_mode(classes):
+    '''
+    문자 종류로 데이터 전체를 인코딩할 수 있는 모드를 결정하는 함수
+    :param classes: classify로 구한 문자 종류 bytes
+    :return: 모드 string
+    '''
+    if not classes or CLASS_BYTE in classes:
+        return 'Byte'
+    elif CLASS_ALPHANUMERIC in classes:
+        return 'Alphanumeric'
+    return 'Numeric'
+
 def determine_mode(data):
     '''
     입력된 데이터로 qr코드 모드 결정하는 함수
     :param data: 입력 데이터
     :return: 모드 string
     '''
-    if re.match(r'^[0-9]+$', data):
-        return 'Numeric'
-    elif re.match(r'^[0-9A-Z $%*+\-./:]+$', data):
-        return 'Alphanumeric'
-    else:
-        return 'Byte'
+    return get_mode(classify(data)[1])
 
 def get_char_count_indicator_length(version, mode):
     '''
@@ -44,6 +82,39 @@ def get_char_count_indicator_length(version, mode):
             return 16
     return None
 
+def get_max_characters(capacity, version, mode):
+    '''
+    버전별 최대 저장 가능 비트 수로 모드의 최대 문자 수를 계산하는 함수
+    :param capacity: 최대 저장 가능 비트 수
+    :param version: qr코드 버전
+    :param mode: qr코드 모드
+    :return: 최대 문자 수 (Byte 모드는 utf-8 바이트 수)
+    '''
+    if mode == 'Numeric':
+        # 3글자당 10비트, 남은 1글자 4비트, 2글자 7비트
+        available = capacity - 4 - get_char_count_indicator_length(version, mode)
+        rest = available % 10
+        max_characters = available // 10 * 3 + (2 if rest >= 7 else 1 if rest >= 4 else 0)
+    elif mode == 'Alphanumeric':
+        # 2글자당 11비트, 남은 1글자 6비트
+        available = capacity - 4 - get_char_count_indicator_length(version, mode)
+        max_characters = available // 11 * 2 + (1 if available % 11 >= 6 else 0)
+    else: # utf-8
+        # 1바이트당 8비트
+        available = capacity - 16 - get_char_count_indicator_length(version, mode)
+        max_characters = available // 8
+    return max(max_characters, 0)
+
+# (모드, 오류 정정 레벨)별 버전 1~40의 최대 문자 수 테이블
+MAX_CHARACTERS = {
+    (mode, ecc_level): [
+        get_max_characters(capacity, version, mode)
+        for version, capacity in enumerate(constants.QRCODE_CAPACITY[ecc_level], start=1)
+    ]
+    for mode in constants.MODE_BITS
+    for ecc_level in constants.QRCODE_CAPACITY
+}
+
 def get_version(data_length, mode, ecc_level):
     '''
     입력된 데이터의 길이로 qr코드 버전을 결정하는 함수
@@ -53,56 +124,337 @@ def get_version(data_length, mode, ecc_level):
     :return: 버전 int
     '''
 
-    # 사전 정의된 모드 - 오류 정정 레벨별 최대 저장 가능 비트 정보로 버전별 반복
-    for version, capacity in enumerate(constants.QRCODE_CAPACITY[ecc_level], start=1):
-        if mode == 'Numeric':
-            # Numeric 모드 비트 수 계산
-            b_length = 4 + get_char_count_indicator_length(version, mode) + 10 * (data_length // 3)
-            if data_length % 3 == 0:
-                b_length += 0
-            elif data_length % 3 == 1:
-                b_length += 4
-            elif data_length % 3 == 2:
-                b_length += 7
-            # 데이터를 표현 가능한 최소 버전이라면 리턴
-            if b_length <= capacity:
-                return version
-        elif mode == 'Alphanumeric':
-            # Alphanumeric 모드 비트 수 계산
-            b_length = 4 + get_char_count_indicator_length(version, mode) + 11 * (data_length // 2) + 6 * (data_length % 2)
-            # 데이터를 표현 가능한 최소 버전이라면 리턴
-            if b_length <= capacity:
-                return version
-        elif mode == 'Byte': # utf-8
-            # Byte 모드 비트 수 계산
-            b_length = 16 + get_char_count_indicator_length(version, mode) + 8 * data_length
-            # 데이터를 표현 가능한 최소 버전이라면 리턴
-            if b_length <= capacity:
-                return version
+    # 미리 계산된 버전별 최대 문자 수 테이블에서 데이터를 표현 가능한 최소 버전 탐색
+    version = bisect.bisect_left(MAX_CHARACTERS[(mode, ecc_level)], data_length) + 1
     # 모두 데이터를 표현할 수 없다면 오류
-    raise ValueError('데이터 길이가 너무 길어서 모든 버전에 맞지 않습니다.')
+    if version > 40:
+        raise ValueError('데이터 길이가 너무 길어서 모든 버전에 맞지 않습니다.')
+    return version
+
+def get_data_length(data, mode):
+    '''
+    모드에 따라 qr코드에 저장되는 데이터 길이를 구하는 함수
+    :param data: 입력 데이터
+    :param mode: qr코드 모드
+    :return: 문자 수 (Byte 모드는 utf-8 바이트 수)
+    '''
+    if mode == 'Byte':
+        return len(data.encode('utf-8'))
+    return len(data)
+
+def capacity(mode, ecc_level, version=40):
+    '''
+    모드, 오류 정정 레벨, 버전에 저장할 수 있는 최대 문자 수를 구하는 함수
+    :param mode: qr코드 모드
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param version: qr코드 버전 (기본값은 가장 큰 40)
+    :return: 최대 문자 수 (Byte 모드는 utf-8 바이트 수)
+    '''
+    return MAX_CHARACTERS[(mode, ecc_level)][version - 1]
+
+def fits(data, ecc_level, version=40):
+    '''
+    QRCode를 만들지 않고 데이터가 qr코드에 들어가는지 확인하는 함수
+    :param data: 입력 데이터
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param version: 확인할 qr코드 버전 (기본값은 가장 큰 40)
+    :return: 들어가면 True
+    '''
+    encoded, classes = classify(data)
+    mode = get_mode(classes)
+    if get_data_length(data, mode) <= capacity(mode, ecc_level, version):
+        return True
+    # 한 모드로 안 들어가면 여러 모드로 나눠서 확인
+    return get_segments_version(encoded, classes, ecc_level, version)[0] is not None
+
+@lru_cache(maxsize=None)
+def get_numeric_values():
+    '''
+    Numeric 모드 묶음(3자리, 남은 2자리/1자리) -> 값 변환 테이블 (처음 쓸 때 만듦)
+    '''
+    return {f'{i:0{digits}d}'.encode(): i for digits in (1, 2, 3) for i in range(10 ** digits)}
+
+@lru_cache(maxsize=None)
+def get_alphanumeric_values():
+    '''
+    Alphanumeric 모드 묶음(2글자, 남은 1글자) -> 값 변환 테이블 (처음 쓸 때 만듦)
+    '''
+    chars = constants.ALPHANUMERIC_CHARS
+    values = {(first + second).encode(): i * 45 + j for i, first in enumerate(chars) for j, second in enumerate(chars)}
+    values.update({char.encode(): i for i, char in enumerate(chars)})
+    return values
+
+# 데이터를 3자리/2글자 묶음으로 나누는 정규식 (마지막 묶음은 짧을 수 있음)
+NUMERIC_GROUP = re.compile(rb'.{1,3}', re.DOTALL)
+ALPHANUMERIC_GROUP = re.compile(rb'.{1,2}', re.DOTALL)
+# 이보다 묶음이 많으면 차례로 시프트하지 않고 이웃끼리 합치기 (긴 정수를 매번 시프트하면 제곱 시간)
+PACK_PAIRWISE_COUNT = 256
+
+def pack_values(values, width, last_width):
+    '''
+    같은 비트 수의 값들과 마지막 값을 이어 붙여서 정수 하나로 만드는 함수
+    :param values: 값 리스트 (마지막 값만 last_width 비트, 나머지는 width 비트)
+    :param width: 값 하나의 비트 수
+    :param last_width: 마지막 값의 비트 수
+    :return: (값, 비트 수)
+    '''
+    if not values:
+        return 0, 0
+    value, length = values.pop(), last_width
+    if len(values) < PACK_PAIRWISE_COUNT:
+        packed = 0
+        for v in values:
+            packed = (packed << width) | v
+        return (packed << length) | value, length + width * len(values)
+    while values:
+        if len(values) % 2:
+            # 짝이 없는 마지막 값은 뒤쪽 결과에 붙이기
+            value |= values.pop() << length
+            length += width
+        pairs = iter(values)
+        values = [(first << width) | second for first, second in zip(pairs, pairs)]
+        width *= 2
+    return value, length
+
+def encode_numeric(data):
+    '''
+    숫자 데이터를 3자리씩 10비트(남은 2자리 7비트, 1자리 4비트)로 한 번에 묶는 함수
+    :param data: 숫자 ASCII bytes
+    :return: (값, 비트 수)
+    '''
+    values = list(map(get_numeric_values().__getitem__, NUMERIC_GROUP.findall(data)))
+    rest = len(data) % 3
+    return pack_values(values, 10, rest * 3 + 1 if rest else 10)
+
+def encode_alphanumeric(data):
+    '''
+    Alphanumeric 데이터를 2글자씩 11비트(남은 1글자 6비트)로 한 번에 묶는 함수
+    :param data: Alphanumeric ASCII bytes
+    :return: (값, 비트 수)
+    '''
+    values = list(map(get_alphanumeric_values().__getitem__, ALPHANUMERIC_GROUP.findall(data)))
+    return pack_values(values, 11, 6 if len(data) % 2 else 11)
+
+def encode_byte(data):
+    '''
+    바이트 데이터를 8비트씩 한 번에 묶는 함수
+    :param data: bytes
+    :return: (값, 비트 수)
+    '''
+    return int.from_bytes(data, 'big'), len(data) * 8
+
+# 모드별 세그먼트 인코더
+SEGMENT_ENCODERS = {
+    'Numeric': encode_numeric,
+    'Alphanumeric': encode_alphanumeric,
+    'Byte': encode_byte,
+}
+
+def get_segment_bit_length(mode, data_length):
+    '''
+    세그먼트 데이터 부분의 비트 수를 구하는 함수 (모드, 길이 표시 비트 제외)
+    :param mode: qr코드 모드
+    :param data_length: 문자 수 (Byte 모드는 utf-8 바이트 수)
+    :return: 비트 수
+    '''
+    if mode == 'Numeric':
+        # 3글자당 10비트, 남은 1글자 4비트, 2글자 7비트
+        return data_length // 3 * 10 + (0, 4, 7)[data_length % 3]
+    elif mode == 'Alphanumeric':
+        # 2글자당 11비트, 남은 1글자 6비트
+        return data_length // 2 * 11 + data_length % 2 * 6
+    return data_length * 8
+
+def get_segments_bit_length(segments, version):
+    '''
+    여러 세그먼트를 버전에 맞게 인코딩했을 때의 전체 비트 수를 구하는 함수
+    :param segments: (모드, 데이터 bytes) 리스트
+    :param version: qr코드 버전
+    :return: 비트 수
+    '''
+    bit_length = 0
+    for mode, data in segments:
+        bit_length += 4 + get_char_count_indicator_length(version, mode) + get_segment_bit_length(mode, len(data))
+    return bit_length
+
+# 다른 모드로 나눴을 때 헤더 비트보다 절약되는 비트가 많을 수 있는 연속 구간 (문자 종류 bytes 기준)
+# Byte 데이터: 숫자 4개 이상 또는 Alphanumeric 문자 6개 이상, Alphanumeric 데이터: 숫자 7개 이상
+SPLIT_PATTERNS = {
+    'Byte': re.compile(rb'[\x00\x01]{6,}|\x00{4,}'),
+    'Alphanumeric': re.compile(rb'\x00{7,}'),
+}
+# 위 구간의 문자 하나를 다른 모드로 인코딩해서 줄일 수 있는 최대 비트 수 (1/6비트 단위)
+SPLIT_SAVINGS = {
+    'Byte': 48 - 20,
+    'Alphanumeric': 33 - 20,
+}
+# 모드별 문자 하나의 비트 수 (1/6비트 단위)
+CHAR_COSTS = {'Numeric': 20, 'Alphanumeric': 33, 'Byte': 48}
+
+def get_min_bit_length(classes, mode):
+    '''
+    여러 모드로 나눴을 때 가능한 비트 수의 하한을 구하는 함수
+    나눠서 줄일 수 있는 구간의 문자는 가장 작은 비트 수로, 나머지는 mode의 비트 수로 계산한다
+    :param classes: classify로 구한 문자 종류 bytes
+    :param mode: 데이터 전체를 인코딩하는 모드
+    :return: 비트 수 하한, 나눠서 줄어들 수 없으면 None
+    '''
+    pattern = SPLIT_PATTERNS.get(mode)
+    if pattern is None:
+        return None
+    savings = sum(match.end() - match.start() for match in pattern.finditer(classes))
+    if savings == 0:
+        return None
+    # 세그먼트 하나의 최소 헤더 (모드 4비트 + 길이 8비트)
+    return 12 + (len(classes) * CHAR_COSTS[mode] - savings * SPLIT_SAVINGS[mode]) // 6
+
+# 데이터 길이 표시 비트 수가 같은 버전 구간
+VERSION_GROUPS = (range(1, 10), range(10, 27), range(27, 41))
+# 세그먼트 분할에서 사용하는 모드 순서
+SEGMENT_MODES = ('Numeric', 'Alphanumeric', 'Byte')
+# 인코딩할 수 없는 모드의 비용
+INFINITY = 1 << 62
+
+def make_segments(encoded, classes, version):
+    '''
+    전체 비트 수가 가장 작도록 데이터를 Numeric/Alphanumeric/Byte 세그먼트로 나누는 함수
+    바이트마다 각 모드로 끝나는 가장 짧은 인코딩 길이를 동적 계획법으로 구한다
+    (Numeric 1글자 10/3비트, Alphanumeric 1글자 11/2비트를 정수로 다루기 위해 1/6비트 단위로 계산,
+    ASCII가 아닌 바이트는 Byte 모드로만 인코딩되므로 utf-8 문자 중간에서 나뉘지 않는다)
+    :param encoded: utf-8 bytes
+    :param classes: classify로 구한 문자 종류 bytes
+    :param version: qr코드 버전 (데이터 길이 표시 비트 수 결정에 사용)
+    :return: (모드, 데이터 bytes) 리스트
+    '''
+    if not encoded:
+        return []
+    # 모드를 새로 시작할 때 드는 모드, 길이 표시 비트 수
+    numeric_header, alphanumeric_header, byte_header = [
+        (4 + get_char_count_indicator_length(version, mode)) * 6 for mode in SEGMENT_MODES
+    ]
+    # 바이트마다 모드별로 직전 바이트의 모드 (역추적용)
+    numeric_from = bytearray(len(classes))
+    alphanumeric_from = bytearray(len(classes))
+    byte_from = bytearray(len(classes))
+
+    first = classes[0]
+    numeric = numeric_header + 20 if first == 0 else INFINITY
+    alphanumeric = alphanumeric_header + 33 if first <= 1 else INFINITY
+    byte = byte_header + 48
+    numeric_from[0], alphanumeric_from[0], byte_from[0] = 0, 1, 2
+    for i in range(1, len(classes)):
+        char_class = classes[i]
+        # 이전 세그먼트를 끝낼 때는 비트 단위로 올림
+        numeric_closed = -(-numeric // 6) * 6
+        alphanumeric_closed = -(-alphanumeric // 6) * 6
+        byte_closed = -(-byte // 6) * 6
+
+        # Byte: 이어가기, Numeric/Alphanumeric 에서 새로 시작 중 가장 짧은 것
+        best, source = byte, 2
+        if numeric_closed + byte_header < best:
+            best, source = numeric_closed + byte_header, 0
+        if alphanumeric_closed + byte_header < best:
+            best, source = alphanumeric_closed + byte_header, 1
+        new_byte = best + 48
+        byte_from[i] = source
+
+        if char_class <= 1:
+            best, source = alphanumeric, 1
+            if numeric_closed + alphanumeric_header < best:
+                best, source = numeric_closed + alphanumeric_header, 0
+            if byte_closed + alphanumeric_header < best:
+                best, source = byte_closed + alphanumeric_header, 2
+            new_alphanumeric = best + 33
+            alphanumeric_from[i] = source
+        else:
+            new_alphanumeric = INFINITY
+
+        if char_class == 0:
+            best, source = numeric, 0
+            if alphanumeric_closed + numeric_header < best:
+                best, source = alphanumeric_closed + numeric_header, 1
+            if byte_closed + numeric_header < best:
+                best, source = byte_closed + numeric_header, 2
+            numeric = best + 20
+            numeric_from[i] = source
+        else:
+            numeric = INFINITY
+        alphanumeric = new_alphanumeric
+        byte = new_byte
+
+    # 가장 짧은 마지막 모드부터 거꾸로 따라가며 모드가 바뀌는 위치에서 세그먼트 나누기
+    costs = (numeric, alphanumeric, byte)
+    mode = costs.index(min(costs))
+    sources = (numeric_from, alphanumeric_from, byte_from)
+    segments = []
+    end = len(classes)
+    for i in range(len(classes) - 1, 0, -1):
+        previous = sources[mode][i]
+        if previous != mode:
+            segments.append((SEGMENT_MODES[mode], encoded[i:end]))
+            end = i
+            mode = previous
+    segments.append((SEGMENT_MODES[mode], encoded[:end]))
+    segments.reverse()
+    return segments
+
+def get_segments_version(encoded, classes, ecc_level, max_version=40):
+    '''
+    데이터를 여러 모드 세그먼트로 나눠서 들어가는 최소 버전과 세그먼트를 구하는 함수
+    길이 표시 비트 수가 버전 구간마다 다르므로 구간마다 따로 분할하고,
+    비트 수 하한이 들어갈 수 없는 구간은 분할하지 않고 건너뛴다
+    :param encoded: utf-8 bytes
+    :param classes: classify로 구한 문자 종류 bytes
+    :param ecc_level: qr코드 오류 정정 레벨
+    :param max_version: 찾을 최대 버전
+    :return: (버전, 세그먼트 리스트), max_version 이하에 맞지 않거나 나눠서 줄어들 수 없으면 (None, None)
+    '''
+    min_bit_length = get_min_bit_length(classes, get_mode(classes))
+    if min_bit_length is None:
+        return None, None
+    capacities = constants.QRCODE_CAPACITY[ecc_level]
+    for versions in VERSION_GROUPS:
+        last = min(versions[-1], max_version)
+        if last < versions[0]:
+            break
+        if capacities[last - 1] < min_bit_length:
+            continue
+        segments = make_segments(encoded, classes, versions[0])
+        bit_length = get_segments_bit_length(segments, versions[0])
+        # 구간 안에서 비트 수가 들어가는 최소 버전 탐색
+        version = bisect.bisect_left(capacities, bit_length, versions[0] - 1, last) + 1
+        if version <= last:
+            return version, segments
+    return None, None
+
+def check_render_options(box_size, border):
+    '''
+    출력할 때 사용하는 모듈 크기와 여백 값을 확인하는 함수
+    :param box_size: 모듈 하나의 크기 (1 이상)
+    :param border: 바깥 여백(quiet zone) 모듈 개수 (0 이상)
+    '''
+    if not isinstance(box_size, int) or box_size < 1:
+        raise ValueError(f'모듈 크기는 1 이상의 정수여야 합니다: {box_size!r}')
+    if not isinstance(border, int) or border < 0:
+        raise ValueError(f'여백은 0 이상의 정수여야 합니다: {border!r}')
 
 def add_terminator_and_pad(encoded_data, total_bits):
     '''
     인코드 데이터에 종단자/패딩 비트 추가하는 함수
-    :param encoded_data: 인코드 데이터
+    :param encoded_data: 인코드 데이터 BitBuffer
     :param total_bits: qr코드의 총 비트 수
-    :return: 종단자/패딩 비트가 추가된 인코드 데이터
+    :return: 종단자/패딩 비트가 추가된 인코드 데이터 BitBuffer
     '''
 
     # 남은 비트 수가 4개 이하면 남은 수 만큼 0 추가
-    for _ in range(min(4, total_bits - len(encoded_data))):
-        encoded_data += '0'
+    encoded_data.put(0, min(4, total_bits - len(encoded_data)))
 
     # 8 비트 단위로 끊을 수 있도록 0 비트 추가
-    while len(encoded_data) % 8 != 0:
-        encoded_data += '0'
+    encoded_data.put(0, -len(encoded_data) % 8)
 
-    # 두 패딩 비트를 번갈아 가며 총 비트 수에 맞게 추가
-    padding_patterns = ['11101100', '00010001']
+    # 두 패딩 바이트를 번갈아 가며 총 비트 수에 맞게 추가
     bytes_to_fill = (total_bits - len(encoded_data)) // 8
-    for i in range(bytes_to_fill):
-        encoded_data += padding_patterns[i % 2]
+    encoded_data.put_bytes(PADDING_BYTES * (bytes_to_fill // 2) + PADDING_BYTES[:bytes_to_fill % 2])
     return encoded_data
 
 def evaluate_mask(modules, module_count):
@@ -168,3 +520,140 @@ def evaluate_mask(modules, module_count):
     penalty += k * 10
 
     return penalty
+
+def evaluate_masks_python(candidates, module_count):
+    '''
+    마스크 후보들의 패널티를 순수 파이썬으로 계산하는 함수
+    :param candidates: 마스크 후보 qr코드 2darray 리스트
+    :param module_count: 모듈 개수
+    :return: 후보별 패널티 점수 리스트
+    '''
+    return [evaluate_mask(modules, module_count) for modules in candidates]
+
+def evaluate_masks_numpy(candidates, module_count):
+    '''
+    마스크 후보들을 (후보 수, N, N) 배열로 쌓아서 한 번에 패널티를 계산하는 함수
+    evaluate_mask와 같은 점수를 계산한다
+    :param candidates: 마스크 후보 qr코드 2darray 리스트
+    :param module_count: 모듈 개수
+    :return: 후보별 패널티 점수 리스트
+    '''
+    import numpy as np
+
+    modules = np.array(candidates, dtype=np.uint8)
+    penalty = np.zeros(len(candidates), dtype=np.int64)
+
+    for lines in (modules, modules.transpose(0, 2, 1)):
+        # 옆 모듈과 같은 색인지 여부
+        same = lines[:, :, 1:] == lines[:, :, :-1]
+
+        # Rule 1: 길이 L(>=5)인 연속 구간은 L - 2점
+        # 같은 색 쌍이 4개 연속인 위치 개수(L - 4) + 구간 시작마다 2점
+        run = same[:, :, :-3] & same[:, :, 1:-2] & same[:, :, 2:-1] & same[:, :, 3:]
+        starts = run[:, :, 0].sum(axis=1) + (run[:, :, 1:] & ~run[:, :, :-1]).sum(axis=(1, 2))
+        penalty += run.sum(axis=(1, 2)) + 2 * starts
+
+        # Rule 3: 1:1:3:1:1 패턴 (같음, 다름, 같음, 같음, 다름, 같음)
+        pattern = (same[:, :, 0:-5] & ~same[:, :, 1:-4] & same[:, :, 2:-3] &
+                   same[:, :, 3:-2] & ~same[:, :, 4:-1] & same[:, :, 5:])
+        penalty += 40 * pattern.sum(axis=(1, 2))
+
+    # Rule 2: 2x2 블록 패턴
+    top_left = modules[:, :-1, :-1]
+    block = ((top_left == modules[:, :-1, 1:]) &
+             (top_left == modules[:, 1:, :-1]) &
+             (top_left == modules[:, 1:, 1:]))
+    penalty += 3 * block.sum(axis=(1, 2))
+
+    # Rule 4: 전체 모듈의 흑백 비율
+    total_modules = module_count * module_count
+    dark_modules = (modules == 1).sum(axis=(1, 2))
+    penalty += np.abs(dark_modules * 2 - total_modules) // total_modules * 10
+
+    return [int(p) for p in penalty]
+
+# 0/1 모듈 값을 '0'/'1' 문자로 바꾸는 변환 테이블
+MODULE_CHAR_TABLE = bytes.maketrans(b'\x00\x01', b'01')
+
+def bitboard_penalty(lines, width):
+    '''
+    한 방향(행 또는 열)의 Rule 1, Rule 3 패널티를 비트 연산으로 계산하는 함수
+    :param lines: 각 줄을 정수 하나로 표현한 리스트
+    :param width: 줄의 모듈 개수
+    :return: 패널티 점수
+    '''
+    same_mask = (1 << (width - 1)) - 1
+    penalty = 0
+    for line in lines:
+        # 옆 모듈과 같은 색이면 1
+        same = ~(line ^ (line >> 1)) & same_mask
+
+        # Rule 1: 같은 색 쌍이 4개 연속인 위치 개수(L - 4) + 구간 시작마다 2점 = L - 2
+        run = same & (same >> 1) & (same >> 2) & (same >> 3)
+        if run:
+            penalty += run.bit_count() + 2 * (run & ~(run << 1)).bit_count()
+
+        # Rule 3: 1:1:3:1:1 패턴 (같음, 다름, 같음, 같음, 다름, 같음)
+        differ = ~same
+        pattern = same & (differ >> 1) & (same >> 2) & (same >> 3) & (differ >> 4) & (same >> 5)
+        pattern &= (1 << (width - 6)) - 1
+        if pattern:
+            penalty += 40 * pattern.bit_count()
+    return penalty
+
+def evaluate_masks_bitboard(candidates, module_count):
+    '''
+    각 행과 열을 파이썬 정수 하나로 표현해서 패널티를 계산하는 함수 (numpy 불필요)
+    evaluate_mask와 같은 점수를 계산한다
+    :param candidates: 마스크 후보 qr코드 2darray 리스트
+    :param module_count: 모듈 개수
+    :return: 후보별 패널티 점수 리스트
+    '''
+    same_mask = (1 << (module_count - 1)) - 1
+    total_modules = module_count * module_count
+    penalties = []
+    for modules in candidates:
+        flat = bytes(m for row in modules for m in row).translate(MODULE_CHAR_TABLE)
+        rows = [int(flat[i:i + module_count], 2) for i in range(0, total_modules, module_count)]
+        cols = [int(flat[i::module_count], 2) for i in range(module_count)]
+
+        # Rule 1, Rule 3: 행/열 방향
+        penalty = bitboard_penalty(rows, module_count) + bitboard_penalty(cols, module_count)
+
+        # Rule 2: 2x2 블록 패턴 (위아래 행이 같고 좌우로도 같은 위치)
+        for upper, lower in zip(rows, rows[1:]):
+            vertical = ~(upper ^ lower)
+            block = (vertical & (vertical >> 1) &
+                     ~(upper ^ (upper >> 1)) & ~(lower ^ (lower >> 1)) & same_mask)
+            if block:
+                penalty += 3 * block.bit_count()
+
+        # Rule 4: 전체 모듈의 흑백 비율
+        dark_modules = sum(row.bit_count() for row in rows)
+        penalty += abs(dark_modules * 2 - total_modules) // total_modules * 10
+        penalties.append(penalty)
+    return penalties
+
+# 사용 가능한 마스크 패널티 계산 방식
+MASK_EVALUATORS = {
+    'python': evaluate_masks_python,
+    'bitboard': evaluate_masks_bitboard,
+}
+if HAS_NUMPY:
+    MASK_EVALUATORS['numpy'] = evaluate_masks_numpy
+
+# 기본 마스크 패널티 계산 방식 (numpy가 없으면 비트보드 방식)
+DEFAULT_MASK_EVALUATOR = 'numpy' if HAS_NUMPY else 'bitboard'
+
+def evaluate_masks(candidates, module_count, backend=None):
+    '''
+    마스크 후보들의 패널티를 선택한 방식으로 계산하는 함수
+    :param candidates: 마스크 후보 qr코드 2darray 리스트
+    :param module_count: 모듈 개수
+    :param backend: 계산 방식 (None이면 DEFAULT_MASK_EVALUATOR)
+    :return: 후보별 패널티 점수 리스트
+    '''
+    backend = backend or DEFAULT_MASK_EVALUATOR
+    if backend not in MASK_EVALUATORS:
+        raise ValueError(f'사용할 수 없는 마스크 패널티 계산 방식입니다: {backend}')
+    return MASK_EVALUATORS[backend](candidates, module_count)
@@ -0,0 +1,120 @@
+import zlib
+
+'''
+qr코드를 벡터 이미지(SVG/PDF/EPS)로 저장하는 모듈
+같은 행의 연속된 검정 모듈을 하나의 사각형으로 합치고,
+바로 아래 행에 같은 사각형이 있으면 세로로도 합쳐서 하나의 path로 출력한다
+'''
+
+def get_rectangles(modules, border):
+    '''
+    검정 모듈을 사각형으로 합치는 함수
+    :param modules: qr코드 2darray
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    :return: 여백을 포함한 모듈 좌표 기준 (x, y, 가로, 세로) 리스트
+    '''
+    rectangles = []
+    # 이전 행까지 이어지고 있는 사각형 (시작 x, 길이) -> rectangles 내 idx
+    opened = {}
+    for y, row in enumerate(modules):
+        current = {}
+        x = 0
+        module_count = len(row)
+        while x < module_count:
+            if not row[x]:
+                x += 1
+                continue
+            # 같은 행에서 연속된 검정 모듈 길이 구하기
+            start = x
+            while x < module_count and row[x]:
+                x += 1
+            key = (start, x - start)
+            if key in opened:
+                # 위 행의 같은 사각형을 아래로 늘리기
+                idx = opened[key]
+                left, top, width, height = rectangles[idx]
+                rectangles[idx] = (left, top, width, height + 1)
+            else:
+                idx = len(rectangles)
+                rectangles.append((start + border, y + border, x - start, 1))
+            current[key] = idx
+        opened = current
+    return rectangles
+
+def write_svg(modules, stream, box_size=4, border=4):
+    '''
+    qr코드를 SVG로 출력하는 함수
+    :param modules: qr코드 2darray
+    :param stream: 출력 파일 객체 (바이너리 write 지원)
+    :param box_size: 모듈 하나의 픽셀 크기
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    '''
+    size = len(modules) + border * 2
+    path = ''.join(f'M{x} {y}h{w}v{h}h-{w}z' for x, y, w, h in get_rectangles(modules, border))
+    stream.write((
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size * box_size}" height="{size * box_size}" '
+        f'viewBox="0 0 {size} {size}" shape-rendering="crispEdges">'
+        f'<rect width="{size}" height="{size}" fill="#fff"/>'
+        f'<path d="{path}" fill="#000"/>'
+        '</svg>\n'
+    ).encode('ascii'))
+
+def write_pdf(modules, stream, box_size=4, border=4):
+    '''
+    qr코드를 한 페이지짜리 PDF로 출력하는 함수 (1pt = 1px 기준)
+    :param modules: qr코드 2darray
+    :param stream: 출력 파일 객체 (바이너리 write 지원)
+    :param box_size: 모듈 하나의 크기 (pt)
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    '''
+    size = len(modules) + border * 2
+    # PDF 좌표계는 아래가 0이므로 y를 뒤집어서 사각형 추가
+    content = (
+        f'{box_size} 0 0 {box_size} 0 0 cm\n1 g 0 0 {size} {size} re f\n0 g\n' +
+        ''.join(f'{x} {size - y - h} {w} {h} re\n' for x, y, w, h in get_rectangles(modules, border)) +
+        'f\n'
+    ).encode('ascii')
+    content = zlib.compress(content, 9)
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {size * box_size} {size * box_size}] '
+        f'/Contents 4 0 R /Resources << >> >>'.encode('ascii'),
+        f'<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n'.encode('ascii') + content + b'\nendstream',
+    ]
+
+    # 객체별 시작 위치를 기록하면서 출력
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for idx, obj in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f'{idx} 0 obj\n'.encode('ascii') + obj + b'\nendobj\n'
+    xref = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('ascii')
+    for offset in offsets:
+        output += f'{offset:010d} 00000 n \n'.encode('ascii')
+    output += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('ascii')
+    stream.write(output)
+
+def write_eps(modules, stream, box_size=4, border=4):
+    '''
+    qr코드를 EPS로 출력하는 함수 (1pt = 1px 기준)
+    :param modules: qr코드 2darray
+    :param stream: 출력 파일 객체 (바이너리 write 지원)
+    :param box_size: 모듈 하나의 크기 (pt)
+    :param border: 바깥 여백(quiet zone) 모듈 개수
+    '''
+    size = len(modules) + border * 2
+    stream.write((
+        '%!PS-Adobe-3.0 EPSF-3.0\n'
+        f'%%BoundingBox: 0 0 {size * box_size} {size * box_size}\n'
+        '%%EndComments\n'
+        # x y w h re: 사각형 path 추가
+        '/re { 4 2 roll moveto 1 index 0 rlineto 0 exch rlineto neg 0 rlineto closepath } bind def\n'
+        f'{box_size} {box_size} scale\n'
+        f'1 setgray 0 0 {size} {size} rectfill\n0 setgray newpath\n' +
+        ''.join(f'{x} {size - y - h} {w} {h} re\n' for x, y, w, h in get_rectangles(modules, border)) +
+        'fill\nshowpage\n%%EOF\n'
+    ).encode('ascii'))
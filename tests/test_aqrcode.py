@@ -0,0 +1,155 @@
+'''
+비동기 렌더러 테스트 (같은 요청 합치기, 취소 후 재요청, 동시 실행 수 제한, 여러 이벤트 루프)
+'''
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import qrcode.aqrcode as aqrcode
+
+
+class SlowRender(object):
+    '''
+    release() 를 부를 때까지 끝나지 않는 render_bytes 대신 쓰는 함수
+    '''
+    def __init__(self):
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+        self.gate = threading.Event()
+
+    def __call__(self, data, *args):
+        with self.lock:
+            self.calls.append(data)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        self.gate.wait(5)
+        with self.lock:
+            self.running -= 1
+        return data.encode()
+
+
+@pytest.fixture
+def slow_render(monkeypatch):
+    render = SlowRender()
+    monkeypatch.setattr(aqrcode, 'render_bytes', render)
+    yield render
+    render.gate.set()
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(4) as executor:
+        yield executor
+
+
+async def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.001)
+
+
+def test_coalesces_identical_requests(slow_render, executor):
+    renderer = aqrcode.AsyncRenderer(executor)
+
+    async def main():
+        tasks = [asyncio.ensure_future(renderer.render('same')) for _ in range(5)]
+        await wait_for(lambda: slow_render.calls)
+        slow_render.gate.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(main()) == [b'same'] * 5
+    assert slow_render.calls == ['same']
+
+
+def test_cancel_one_waiter_keeps_others(slow_render, executor):
+    renderer = aqrcode.AsyncRenderer(executor)
+
+    async def main():
+        first = asyncio.ensure_future(renderer.render('same'))
+        second = asyncio.ensure_future(renderer.render('same'))
+        await wait_for(lambda: slow_render.calls)
+        first.cancel()
+        slow_render.gate.set()
+        return await second
+
+    assert asyncio.run(main()) == b'same'
+
+
+def test_retry_after_cancel(slow_render, executor):
+    renderer = aqrcode.AsyncRenderer(executor)
+
+    async def main():
+        task = asyncio.ensure_future(renderer.render('retry'))
+        await wait_for(lambda: slow_render.calls)
+        task.cancel()
+        # 취소 직후 같은 요청은 취소된 작업을 기다리지 않고 새로 생성
+        retry = asyncio.ensure_future(renderer.render('retry'))
+        await asyncio.sleep(0)
+        slow_render.gate.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await retry
+
+    assert asyncio.run(main()) == b'retry'
+
+
+def test_cancelled_job_keeps_concurrency_slot(slow_render, executor):
+    renderer = aqrcode.AsyncRenderer(executor, max_concurrency=1)
+
+    async def main():
+        task = asyncio.ensure_future(renderer.render('first'))
+        await wait_for(lambda: slow_render.calls)
+        task.cancel()
+        other = asyncio.ensure_future(renderer.render('second'))
+        await asyncio.sleep(0.05)
+        # 취소된 작업이 executor에서 끝나기 전에는 다음 작업이 시작되지 않음
+        assert slow_render.calls == ['first']
+        slow_render.gate.set()
+        return await other
+
+    assert asyncio.run(main()) == b'second'
+    assert slow_render.max_running == 1
+
+
+def test_cancel_before_start_releases_slot(slow_render, executor):
+    renderer = aqrcode.AsyncRenderer(executor, max_concurrency=1)
+
+    async def main():
+        running = asyncio.ensure_future(renderer.render('running'))
+        waiting = asyncio.ensure_future(renderer.render('waiting'))
+        await wait_for(lambda: slow_render.calls)
+        waiting.cancel()
+        slow_render.gate.set()
+        assert await running == b'running'
+        return await renderer.render('next')
+
+    assert asyncio.run(main()) == b'next'
+    assert 'waiting' not in slow_render.calls
+
+
+def test_multiple_event_loops():
+    # executor를 지정하지 않은 렌더러 (기본 렌더러와 같은 설정)
+    renderer = aqrcode.AsyncRenderer(max_concurrency=2)
+    expected = aqrcode.render_bytes('loop')
+    # 여러 번의 asyncio.run
+    assert asyncio.run(renderer.render('loop')) == expected
+    assert asyncio.run(renderer.render('loop')) == expected
+
+    # 여러 스레드의 이벤트 루프에서 동시에 같은 요청
+    results = []
+
+    def run():
+        results.append(asyncio.run(asyncio.wait_for(renderer.render('loop'), 10)))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 4
@@ -0,0 +1,63 @@
+'''
+디스크 캐시 테스트 (파일 권한, 읽기 실패, 크기/기간 제한 정리)
+'''
+import os
+import stat
+import time
+
+import qrcode.disk_cache as disk_cache
+
+
+def cache_files(directory):
+    return [entry for shard in os.scandir(directory) if shard.is_dir()
+            for entry in os.scandir(shard.path) if not entry.name.startswith('.tmp-')]
+
+
+def test_entries_readable_by_other_users(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    cache.put('key', b'value')
+    assert stat.S_IMODE(os.stat(cache.get_path('key')).st_mode) == disk_cache.FILE_MODE
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    # 파일 대신 폴더가 있어서 읽을 수 없는 항목
+    os.makedirs(cache.get_path('key'))
+    assert cache.get('key') is None
+    assert cache.stats()['misses'] == 1
+
+
+def test_put_enforces_size_cap(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path, max_bytes=5000, evict_every=5)
+    for i in range(60):
+        cache.put(i, bytes(500))
+        cache.wait_for_eviction()
+    total = sum(entry.stat().st_size for entry in cache_files(tmp_path))
+    # 마지막 정리 이후 evict_every 개 미만만 더 쓰였음
+    assert total <= 5000 + 5 * 500
+    assert cache.stats()['evictions'] >= 40
+    assert cache.get(59) == bytes(500)
+
+
+def test_put_enforces_max_age(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path, max_age=60, evict_every=3)
+    cache.put('old', b'old')
+    cache.put('new', b'new')
+    past = time.time() - 120
+    os.utime(cache.get_path('old'), (past, past))
+    assert cache.get('old') is None
+
+    cache.put('newer', b'newer')
+    cache.wait_for_eviction()
+    assert not os.path.exists(cache.get_path('old'))
+    assert cache.get('new') == b'new'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_evict_every_none_disables_automatic_eviction(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path, max_bytes=100, evict_every=None)
+    for i in range(10):
+        cache.put(i, bytes(50))
+    assert cache.evict_thread is None
+    assert len(cache_files(tmp_path)) == 10
+    assert cache.evict() == 8
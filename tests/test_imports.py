@@ -0,0 +1,55 @@
+'''
+qrcode 패키지 import 시간 예산 테스트
+python -X importtime 으로 새 프로세스에서 모듈을 불러오는 시간을 재고
+예산을 넘거나 Pillow/numpy를 미리 불러오면 실패한다
+'''
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+# qrcode.qrcode import 시간 예산 (ms, 여러 번 잰 중앙값 기준)
+IMPORT_BUDGET_MS = 50
+# import 시점에 불러오면 안 되는 무거운 모듈
+LAZY_MODULES = ('PIL', 'numpy')
+# 저장소 최상위 폴더
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module):
+    '''
+    새 프로세스에서 모듈 import 누적 시간(ms)과 함께 불러온 무거운 모듈 목록 측정
+    '''
+    code = f'import sys, {module}; print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))'
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True, cwd=ROOT
+    )
+    elapsed = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            elapsed = int(parts[1]) / 1000
+    loaded = [m for m in result.stdout.strip().split(',') if m]
+    return elapsed, loaded
+
+
+@pytest.mark.parametrize('module', ['qrcode.qrcode', 'qrcode.batch', 'qrcode.cli'])
+def test_no_eager_heavy_imports(module):
+    _, loaded = measure_import(module)
+    assert loaded == []
+
+
+def test_import_time_budget():
+    samples = [measure_import('qrcode.qrcode')[0] for _ in range(5)]
+    assert statistics.median(samples) <= IMPORT_BUDGET_MS
+
+
+def test_encoder_tables_built_on_first_use():
+    code = ('import qrcode.util as util; '
+            'print(util.get_numeric_values.cache_info().currsize, util.get_alphanumeric_values.cache_info().currsize)')
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=ROOT)
+    assert result.stdout.split() == ['0', '0']
@@ -0,0 +1,42 @@
+'''
+포맷 정보, 버전 정보 테이블 테스트
+'''
+import pytest
+
+import error_correction.bch as bch
+import qrcode.constants as constants
+import qrcode.layout as layout
+
+ECC_LEVELS = [constants.ERROR_LEVEL_L, constants.ERROR_LEVEL_M, constants.ERROR_LEVEL_Q, constants.ERROR_LEVEL_H]
+
+
+@pytest.mark.parametrize('ecc_level', ECC_LEVELS)
+@pytest.mark.parametrize('mask_bit', constants.MASK_BITS)
+def test_format_information(ecc_level, mask_bit):
+    format_bit = constants.ERROR_LEVEL_BITS[ecc_level] + mask_bit
+    codeword = layout.get_format_information(ecc_level, mask_bit) ^ constants.FORMAT_MASK
+    assert format(codeword, '015b') == format_bit + bch.bch_encode(int(format_bit, 2), 15, 5, constants.FORMAT_GENERATOR)
+    assert bch.bch_verify(codeword, 15, constants.FORMAT_GENERATOR)
+
+
+def test_format_information_words():
+    words = {layout.get_format_information(ecc_level, mask_bit)
+             for ecc_level in ECC_LEVELS for mask_bit in constants.MASK_BITS}
+    assert len(words) == 32
+    # 표준 표의 값 (L, 마스크 000 / H, 마스크 111)
+    assert layout.get_format_information(constants.ERROR_LEVEL_L, '000') == 0b111011111000100
+    assert layout.get_format_information(constants.ERROR_LEVEL_H, '111') == 0b000100000111011
+
+
+@pytest.mark.parametrize('version', range(7, 41))
+def test_version_information(version):
+    codeword = layout.get_version_information(version)
+    assert codeword >> 12 == version
+    assert format(codeword, '018b') == format(version, '06b') + bch.bch_encode(version, 18, 6, constants.VERSION_GENERATOR)
+    assert bch.bch_verify(codeword, 18, constants.VERSION_GENERATOR)
+
+
+def test_version_information_words():
+    # 표준 표의 값 (버전 7, 40)
+    assert layout.get_version_information(7) == 0x07C94
+    assert layout.get_version_information(40) == 0x28C69
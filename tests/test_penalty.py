@@ -0,0 +1,70 @@
+'''
+마스크 패널티 계산 방식(python, numpy, bitboard)이 같은 점수를 내는지 확인하는 테스트
+'''
+import random
+
+import pytest
+
+import qrcode.constants as constants
+import qrcode.layout as layout
+import qrcode.util as util
+from qrcode.qrcode import QRCode
+
+# python 방식과 비교할 계산 방식 (numpy는 설치되어 있을 때만)
+BACKENDS = [
+    'bitboard',
+    pytest.param('numpy', marks=pytest.mark.skipif(not util.HAS_NUMPY, reason='numpy가 설치되어 있지 않음')),
+]
+
+
+def random_candidates(module_count, rnd, count=8, density=0.5):
+    return [
+        [[int(rnd.random() < density) for _ in range(module_count)] for _ in range(module_count)]
+        for _ in range(count)
+    ]
+
+
+def mask_candidates(version, ecc_level, data):
+    '''
+    실제 qr코드의 마스크 후보 8개
+    '''
+    qr = QRCode(data, ecc_level, version=version)
+    data_modules = int.from_bytes(qr.__place_data__(), 'big')
+    return [
+        qr.__to_2darray__(qr.__add_format_information__(qr.__add_data_with_mask__(data_modules, mask_bit), mask_bit))
+        for mask_bit in constants.MASK_BITS
+    ]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('version', [1, 2, 7, 21, 40])
+@pytest.mark.parametrize('density', [0.5, 0.1, 0.9])
+def test_random_matrices(backend, version, density):
+    module_count = layout.get_module_count(version)
+    candidates = random_candidates(module_count, random.Random(version), density=density)
+    expected = util.evaluate_masks(candidates, module_count, 'python')
+    assert util.evaluate_masks(candidates, module_count, backend) == expected
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('version', [1, 3, 7, 10, 25, 40])
+@pytest.mark.parametrize('ecc_level', [constants.ERROR_LEVEL_L, constants.ERROR_LEVEL_H])
+def test_mask_candidates(backend, version, ecc_level):
+    module_count = layout.get_module_count(version)
+    candidates = mask_candidates(version, ecc_level, 'QR 2026')
+    expected = util.evaluate_masks(candidates, module_count, 'python')
+    assert util.evaluate_masks(candidates, module_count, backend) == expected
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_uniform_matrices(backend):
+    # 한 색으로 채운 행렬 (Rule 1, Rule 2, Rule 4가 최대)
+    module_count = layout.get_module_count(1)
+    candidates = [[[color] * module_count for _ in range(module_count)] for color in (0, 1)]
+    expected = util.evaluate_masks(candidates, module_count, 'python')
+    assert util.evaluate_masks(candidates, module_count, backend) == expected
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        util.evaluate_masks([], 21, 'missing')
@@ -0,0 +1,60 @@
+'''
+CSV/JSONL 파이프라인 입력 처리 테스트
+'''
+import io
+import zipfile
+
+import pytest
+
+import qrcode.pipeline as pipeline
+
+
+def run(tmp_path, text, input_format, output='out', **options):
+    output = str(tmp_path / output)
+    stats = pipeline.run_pipeline(io.StringIO(text), output, input_format, workers=1, report=None, **options)
+    return stats, output
+
+
+def test_csv_header_defaults_to_first_column():
+    rows = list(pipeline.read_payloads(io.StringIO('id,url\n7,https://x.io/1\n'), 'csv', name_field='id'))
+    assert rows == [('7', '7')]
+    rows = list(pipeline.read_payloads(io.StringIO('url,id\nhttps://x.io/1,7\n'), 'csv'))
+    assert rows == [('00000000', 'https://x.io/1')]
+
+
+def test_csv_column_number_with_header():
+    rows = list(pipeline.read_payloads(io.StringIO('id,url\n7,https://x.io/1\n'), 'csv', field=1, name_field=0))
+    assert rows == [('7', 'https://x.io/1')]
+
+
+def test_csv_without_header():
+    rows = list(pipeline.read_payloads(io.StringIO('a,b\nc\n'), 'csv', field=1, header=False))
+    assert rows == [('00000000', 'b'), ('00000001', None)]
+
+
+def test_csv_unknown_column():
+    with pytest.raises(ValueError):
+        list(pipeline.read_payloads(io.StringIO('id,url\n7,x\n'), 'csv', field='data'))
+
+
+def test_jsonl_invalid_rows_are_skipped(tmp_path):
+    text = '\n'.join([
+        '{"data": 12345}', '{"data": null}', '{"name": "x"}', 'not json', '[1, 2]', '7',
+        '{"data": "ok"}', '"plain"',
+    ])
+    stats, output = run(tmp_path, text, 'jsonl')
+    assert (stats.count, stats.skipped) == (2, 6)
+
+
+def test_duplicate_names_in_directory(tmp_path):
+    stats, output = run(tmp_path, 'id,url\na,https://x.io/1\na,https://x.io/2\na,https://x.io/3\n', 'csv',
+                        field='url', name_field='id')
+    assert stats.renamed == 2
+    assert sorted(p.name for p in tmp_path.joinpath('out').iterdir()) == ['a.png', 'a_2.png', 'a_3.png']
+
+
+def test_duplicate_names_in_zip(tmp_path):
+    stats, output = run(tmp_path, 'id,url\na,https://x.io/1\na,https://x.io/2\n', 'csv', output='out.zip',
+                        field='url', name_field='id')
+    with zipfile.ZipFile(output) as archive:
+        assert archive.namelist() == ['a.png', 'a_2.png']
@@ -0,0 +1,19 @@
+'''
+출력 옵션 확인 테스트
+'''
+import pytest
+
+import qrcode.constants as constants
+from qrcode.qrcode import QRCode
+
+
+@pytest.mark.parametrize('fmt', constants.OUTPUT_FORMATS)
+@pytest.mark.parametrize('box_size, border', [(0, 4), (-1, 4), (4, -1), (2.5, 4)])
+def test_invalid_render_options(fmt, box_size, border):
+    with pytest.raises(ValueError):
+        QRCode('hello').to_bytes(fmt, box_size, border)
+
+
+@pytest.mark.parametrize('fmt', constants.OUTPUT_FORMATS)
+def test_smallest_render_options(fmt):
+    assert QRCode('hello').to_bytes(fmt, 1, 0)
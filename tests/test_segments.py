@@ -0,0 +1,89 @@
+'''
+문자 종류 판별과 여러 모드 세그먼트 분할 테스트
+'''
+import pytest
+
+import qrcode.constants as constants
+import qrcode.util as util
+from qrcode.qrcode import QRCode
+
+# ASCII가 아닌 문자 바로 뒤에 숫자가 이어지는 데이터
+# ('²', 'ò', '가' 등의 utf-8 연속 바이트에는 0xB2, 0xB3, 0xB9가 들어 있음)
+NON_ASCII_BEFORE_DIGITS = [
+    'x²' + '7' * 50,
+    'abcò123456789012345678901234567890',
+    '가가가ò' + '1' * 40,
+    '¹²³' + '0' * 30 + '¹',
+    'https://example.com/상품/²' + '9' * 60,
+]
+
+
+def test_only_ascii_digits_are_numeric():
+    numeric = [i for i in range(256) if util.CHAR_CLASS_TABLE[i] == util.CLASS_NUMERIC[0]]
+    assert numeric == list(range(0x30, 0x3a))
+
+
+def test_only_ascii_is_alphanumeric():
+    alphanumeric = bytes(i for i in range(256) if util.CHAR_CLASS_TABLE[i] == util.CLASS_ALPHANUMERIC[0])
+    assert alphanumeric.decode('ascii') == ''.join(sorted(set(constants.ALPHANUMERIC_CHARS) - set('0123456789')))
+
+
+@pytest.mark.parametrize('data', NON_ASCII_BEFORE_DIGITS)
+@pytest.mark.parametrize('version', [10, 20, 40])
+def test_segments_keep_non_ascii_in_byte_mode(data, version):
+    encoded, classes = util.classify(data)
+    segments = util.make_segments(encoded, classes, version)
+    assert b''.join(segment for _, segment in segments) == encoded
+    for mode, segment in segments:
+        if mode != 'Byte':
+            # Numeric, Alphanumeric 세그먼트는 ASCII만 포함
+            segment.decode('ascii')
+
+
+@pytest.mark.parametrize('data', NON_ASCII_BEFORE_DIGITS)
+@pytest.mark.parametrize('ecc_level', [constants.ERROR_LEVEL_L, constants.ERROR_LEVEL_H])
+def test_qrcode_with_non_ascii_before_digits(data, ecc_level):
+    qr = QRCode(data, ecc_level)
+    encoded = data.encode('utf-8')
+    assert b''.join(segment for _, segment in qr.segments) == encoded
+    for mode, segment in qr.segments:
+        if mode != 'Byte':
+            segment.decode('ascii')
+
+
+@pytest.mark.parametrize('data', NON_ASCII_BEFORE_DIGITS)
+def test_fixed_version_with_non_ascii_before_digits(data):
+    version = QRCode(data).version
+    assert QRCode(data, version=version).version == version
+
+
+def encode_groups(data, size, width, get_value):
+    '''
+    묶음마다 차례로 시프트해서 붙이는 기준 인코더 (마지막 묶음은 짧으면 width보다 적은 비트)
+    '''
+    value = length = 0
+    for i in range(0, len(data), size):
+        group = data[i:i + size]
+        bits = width if len(group) == size else {1: 4 if size == 3 else 6, 2: 7}[len(group)]
+        value = (value << bits) | get_value(group)
+        length += bits
+    return value, length
+
+
+@pytest.mark.parametrize('length', [0, 1, 2, 3, 4, 5, 6, 7, 767, 768, 769, 770, 771, 7089])
+def test_encode_numeric(length):
+    data = ''.join(str(i * 7 % 10) for i in range(length)).encode()
+    assert util.encode_numeric(data) == encode_groups(data, 3, 10, int)
+
+
+@pytest.mark.parametrize('length', [0, 1, 2, 3, 511, 512, 513, 514, 515, 4296])
+def test_encode_alphanumeric(length):
+    chars = constants.ALPHANUMERIC_CHARS
+    data = ''.join(chars[i * 11 % 45] for i in range(length)).encode()
+
+    def get_value(group):
+        value = 0
+        for char in group.decode():
+            value = value * 45 + chars.index(char)
+        return value
+    assert util.encode_alphanumeric(data) == encode_groups(data, 2, 11, get_value)
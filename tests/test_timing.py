@@ -0,0 +1,48 @@
+'''
+단계별 시간 측정 테스트
+'''
+import pickle
+
+import qrcode.batch as batch
+import qrcode.metrics as metrics
+import qrcode.timing as timing
+from qrcode.qrcode import QRCode
+
+PAYLOADS = [f'https://example.com/{i}' for i in range(20)]
+
+
+def test_records_stages():
+    with timing.collect() as timings:
+        qr = QRCode('hello')
+        qr.to_bytes('svg')
+    stats = timings.stats()
+    assert stats['count'] == 1
+    assert {'encode', 'error_correction', 'placement', 'evaluate_masks', 'render'} <= set(stats['stages'])
+    assert qr.timing.mask_bit == qr.mask_bit
+
+
+def test_no_collector():
+    assert QRCode('hello').timing is None
+
+
+def test_collector_is_picklable():
+    with timing.collect(metrics.Metrics()) as collected:
+        QRCode('hello')
+    assert pickle.loads(pickle.dumps(collected)).count == 1
+
+
+def test_generate_many_workers():
+    with timing.collect() as timings:
+        symbols = list(batch.generate_many(PAYLOADS + PAYLOADS[:5], workers=2))
+    assert len(symbols) == 25
+    # 같은 묶음의 중복 데이터는 한 번만 생성되고 한 번만 기록됨
+    assert timings.count == len(PAYLOADS)
+
+
+def test_render_many_workers_metrics():
+    with timing.collect(metrics.Metrics()) as collected:
+        images = list(batch.render_many(PAYLOADS, fmt='svg', workers=2))
+    assert len(images) == len(PAYLOADS)
+    assert collected.count == len(PAYLOADS)
+    assert sum(collected.renders.values()) == len(PAYLOADS)
+    assert 'qrcode_symbols_total' in collected.render()